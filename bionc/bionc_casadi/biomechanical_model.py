@@ -1,5 +1,5 @@
 import numpy as np
-from casadi import MX, transpose, horzcat, vertcat, solve
+from casadi import MX, transpose, horzcat, vertcat, diagcat, solve, sum1
 from typing import Any
 
 from .biomechanical_model_joints import BiomechanicalModelJoints
@@ -37,10 +37,15 @@ class BiomechanicalModel(GenericBiomechanicalModel):
         self,
         segments: dict[str, Any] | BiomechanicalModelSegments = None,
         joints: dict[str, Any] | BiomechanicalModelJoints = None,
+        jit: bool = False,
     ):
         segments = BiomechanicalModelSegments() if segments is None else segments
         joints = BiomechanicalModelJoints() if joints is None else joints
         markers = BiomechanicalModelMarkers(segments=segments)
+        # when jit is True, the cached constraint Functions are compiled to native code by casadi
+        # through a system C compiler instead of being interpreted by its virtual machine
+        segments.use_jit = jit
+        joints.use_jit = jit
         super().__init__(segments=segments, joints=joints, markers=markers)
         self._numpy_model = None
 
@@ -77,17 +82,19 @@ class BiomechanicalModel(GenericBiomechanicalModel):
         MX
             generalized mass matrix of the segment [12 * nbSegment x 12 * * nbSegment]
         """
-        G = MX.zeros((12 * self.nb_segments, 12 * self.nb_segments))
-        for i, segment in enumerate(self.segments_no_ground.values()):
+        mass_blocks = []
+        for i, _, idx, segment in self.segments.segment_cache:
             Gi = segment.mass_matrix
             if Gi is None:
                 # mass matrix is None if one the segment doesn't have any inertial properties
                 self._mass_matrix = None
                 return
-            idx = slice(12 * i, 12 * (i + 1))
-            G[idx, idx] = segment.mass_matrix
+            mass_blocks.append(Gi)
 
-        self._mass_matrix = G
+        # a single block-diagonal concat node keeps the sparsity pattern explicit
+        self._mass_matrix = (
+            diagcat(*mass_blocks) if mass_blocks else MX.zeros((12 * self.nb_segments, 12 * self.nb_segments))
+        )
 
     def kinetic_energy(self, Qdot: NaturalVelocities) -> MX:
         """
@@ -104,7 +111,14 @@ class BiomechanicalModel(GenericBiomechanicalModel):
             The kinetic energy of the system
         """
 
-        return 0.5 * transpose(Qdot.to_array()) @ self._mass_matrix @ Qdot.to_array()
+        # summing the per-segment 12-dim quadratic forms never materializes the full block-diagonal
+        # mass matrix, so the MX graph only holds nb_segments 12 x 12 products
+        E = 0
+        for i, segment in enumerate(self.segments_no_ground.values()):
+            Qdoti = Qdot.vector(i)
+            E += 0.5 * transpose(Qdoti) @ (segment.mass_matrix @ Qdoti)
+
+        return E
 
     def potential_energy(self, Q: NaturalCoordinates) -> MX:
         """
@@ -143,7 +157,18 @@ class BiomechanicalModel(GenericBiomechanicalModel):
             The lagrangian of the system
         """
 
-        return self.kinetic_energy(Qdot) - self.potential_energy(Q)
+        # one pass over the segments touches the Q and Qdot blocks of each segment together, and the
+        # final sum1 over the stacked terms keeps the MX graph shallow instead of a chain of += nodes
+        terms = []
+        for i, segment in enumerate(self.segments_no_ground.values()):
+            Qi = Q.vector(i)
+            Qdoti = Qdot.vector(i)
+            terms.append(
+                0.5 * transpose(Qdoti.to_array()) @ (segment.mass_matrix @ Qdoti.to_array())
+                - segment.potential_energy(Qi)
+            )
+
+        return sum1(vertcat(*terms)) if terms else MX.zeros(1)
 
     def holonomic_constraints(self, Q: NaturalCoordinates) -> MX:
         """
@@ -1,15 +1,118 @@
-from casadi import MX
+from casadi import MX, Function, vertcat
 from typing import Any
 
 from .biomechanical_model_segments import BiomechanicalModelSegments
 from .natural_coordinates import NaturalCoordinates
 from .natural_velocities import NaturalVelocities
+from .utils import function_options
 from ..protocols.biomechanical_model_joints import GenericBiomechanicalModelJoints
 
 
 class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
     def __init__(self, joints: dict[str, Any] = None):
         super().__init__(joints=joints)
+        self._constraints_functions = None
+        self._constraints_functions_nb_Q = None
+        self.use_jit = False
+
+    @property
+    def joint_factories(self) -> dict:
+        from .enums import JOINT_FACTORIES  # Imported here to prevent from circular imports
+
+        return JOINT_FACTORIES
+
+    def _invalidate_joint_cache(self):
+        super()._invalidate_joint_cache()
+        self._constraints_functions = None
+        self._constraints_functions_nb_Q = None
+
+    def _update_constraints_functions(self, nb_Q: int) -> dict:
+        """
+        This function builds the casadi Functions evaluating the joint constraints, their jacobian and the
+        jacobian derivative. The MX graphs are assembled once through the joint loops and reused on every call,
+        instead of being rebuilt on each invocation.
+
+        Parameters
+        ----------
+        nb_Q : int
+            The number of natural coordinates of the model [12 * nb_segments]
+
+        Returns
+        -------
+        dict[str, Function]
+            The casadi Functions of the joint constraints
+        """
+        Q_sym = NaturalCoordinates.sym(nb_Q // 12)
+        Qdot_sym = NaturalVelocities.sym(nb_Q // 12)
+
+        # the constraint vector is a single concat node; the jacobians keep slice assignment because each
+        # joint row touches both the parent and the child column blocks
+        phi_k_pieces = []
+        K_k = MX.zeros((self.nb_constraints, nb_Q))
+        K_k_dot = MX.zeros((self.nb_constraints, nb_Q))
+
+        for joint, constraint_slice, parent_index, child_index in self.joint_cache:
+            Q_parent = (
+                None if parent_index is None else Q_sym.vector(parent_index)
+            )  # if the joint is a joint with the ground, the parent is None
+            Q_child = Q_sym.vector(child_index)
+            Qdot_parent = None if parent_index is None else Qdot_sym.vector(parent_index)
+            Qdot_child = Qdot_sym.vector(child_index)
+
+            phi_k_pieces.append(joint.constraint(Q_parent, Q_child))
+
+            if parent_index is not None:  # If the joint is not a ground joint
+                K_k[constraint_slice, joint.parent.coordinates_slice] = joint.parent_constraint_jacobian(
+                    Q_parent, Q_child
+                )
+                K_k_dot[constraint_slice, joint.parent.coordinates_slice] = joint.parent_constraint_jacobian_derivative(
+                    Qdot_parent, Qdot_child
+                )
+
+            K_k[constraint_slice, joint.child.coordinates_slice] = joint.child_constraint_jacobian(Q_parent, Q_child)
+            K_k_dot[constraint_slice, joint.child.coordinates_slice] = joint.child_constraint_jacobian_derivative(
+                Qdot_parent, Qdot_child
+            )
+
+        Phi_k = vertcat(*phi_k_pieces) if phi_k_pieces else MX.zeros(self.nb_constraints)
+
+        # expand() re-traces the MX graphs into SX, whose scalar representation evaluates faster
+        # and exposes every operation to casadi's common-subexpression elimination
+        options = function_options(getattr(self, "use_jit", False))
+        self._constraints_functions = dict(
+            constraints=Function("joint_constraints", [Q_sym], [Phi_k]).expand("joint_constraints", options),
+            constraints_jacobian=Function("joint_constraints_jacobian", [Q_sym], [K_k]).expand(
+                "joint_constraints_jacobian", options
+            ),
+            constraints_jacobian_derivative=Function(
+                "joint_constraints_jacobian_derivative", [Qdot_sym], [K_k_dot]
+            ).expand("joint_constraints_jacobian_derivative", options),
+        )
+        self._constraints_functions_nb_Q = nb_Q
+        return self._constraints_functions
+
+    def constraints_functions(self, nb_Q: int) -> dict:
+        """
+        This function returns the cached casadi Functions of the joint constraints, building them on first use.
+
+        Parameters
+        ----------
+        nb_Q : int
+            The number of natural coordinates of the model [12 * nb_segments]
+
+        Returns
+        -------
+        dict[str, Function]
+            The casadi Functions of the joint constraints
+        """
+        # the cache is also keyed on nb_Q: adding a segment after the first build changes the size of
+        # the Q vector without going through the joints, and the old Functions would be wrongly shaped
+        if (
+            getattr(self, "_constraints_functions", None) is None
+            or getattr(self, "_constraints_functions_nb_Q", None) != nb_Q
+        ):
+            self._update_constraints_functions(nb_Q)
+        return self._constraints_functions
 
     def constraints(self, Q: NaturalCoordinates) -> MX:
         """
@@ -27,19 +130,7 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             Joint constraints of the segment [nb_joint_constraints, 1]
         """
 
-        Phi_k = MX.zeros(self.nb_constraints)
-
-        for joint_name, joint in self.joints_with_constraints.items():
-            constraint_slice = self.constraints_index(joint.index)
-
-            Q_parent = (
-                None if joint.parent is None else Q.vector(joint.parent.index)
-            )  # if the joint is a joint with the ground, the parent is None
-            Q_child = Q.vector(joint.child.index)
-
-            Phi_k[constraint_slice] = joint.constraint(Q_parent, Q_child)
-
-        return Phi_k
+        return self.constraints_functions(Q.shape[0])["constraints"](Q)
 
     def constraints_jacobian(self, Q: NaturalCoordinates) -> MX:
         """
@@ -57,25 +148,7 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             Joint constraints of the segment [nb_joint_constraints, nbQ]
         """
 
-        K_k = MX.zeros((self.nb_constraints, Q.shape[0]))
-
-        for joint_name, joint in self.joints_with_constraints.items():
-            idx_row = self.constraints_index(joint.index)
-
-            idx_col_child = joint.child.coordinates_slice
-            idx_col_parent = joint.parent.coordinates_slice if joint.parent is not None else None
-
-            Q_parent = (
-                None if joint.parent is None else Q.vector(joint.parent.index)
-            )  # if the joint is a joint with the ground, the parent is None
-            Q_child = Q.vector(joint.child.index)
-
-            if joint.parent is not None:  # If the joint is not a ground joint
-                K_k[idx_row, idx_col_parent] = joint.parent_constraint_jacobian(Q_parent, Q_child)
-
-            K_k[idx_row, idx_col_child] = joint.child_constraint_jacobian(Q_parent, Q_child)
-
-        return K_k
+        return self.constraints_functions(Q.shape[0])["constraints_jacobian"](Q)
 
     def constraints_jacobian_derivative(self, Qdot: NaturalVelocities) -> MX:
         """
@@ -92,22 +165,4 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             The derivative of the Jacobian matrix of the joint constraints [nb_joint_constraints, 12 * nb_segments]
         """
 
-        K_k_dot = MX.zeros((self.nb_constraints, Qdot.shape[0]))
-
-        for joint_name, joint in self.joints_with_constraints.items():
-            idx_row = self.constraints_index(joint.index)
-
-            idx_col_child = joint.child.coordinates_slice
-            idx_col_parent = joint.parent.coordinates_slice if joint.parent is not None else None
-
-            Qdot_parent = (
-                None if joint.parent is None else Qdot.vector(joint.parent.index)
-            )  # if the joint is a joint with the ground, the parent is None
-            Qdot_child = Qdot.vector(joint.child.index)
-
-            if joint.parent is not None:  # If the joint is not a ground joint
-                K_k_dot[idx_row, idx_col_parent] = joint.parent_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
-
-            K_k_dot[idx_row, idx_col_child] = joint.child_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
-
-        return K_k_dot
+        return self.constraints_functions(Qdot.shape[0])["constraints_jacobian_derivative"](Qdot)
@@ -1,8 +1,9 @@
-from casadi import MX
+from casadi import MX, Function, Sparsity, diagcat, horzcat, horzsplit, reshape
 from typing import Any
 
 from .natural_coordinates import NaturalCoordinates
 from .natural_velocities import NaturalVelocities
+from .utils import function_options
 from ..protocols.biomechanical_model import GenericBiomechanicalModelSegments
 
 
@@ -22,6 +23,79 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
         segments: dict[str:Any, ...] = None,
     ):
         super().__init__(segments=segments)
+        self._constraints_functions = None
+        self.use_jit = False
+
+    def _invalidate_segment_cache(self):
+        super()._invalidate_segment_cache()
+        self._constraints_functions = None
+
+    @property
+    def constraints_functions(self) -> dict:
+        """
+        This function returns the casadi Functions evaluating the rigid body constraints, their derivative,
+        their jacobian and the jacobian derivative. The MX graphs are assembled once through the segment loops
+        and reused on every call, instead of being rebuilt on each invocation.
+
+        Returns
+        -------
+        dict[str, Function]
+            The casadi Functions of the rigid body constraints
+        """
+        if getattr(self, "_constraints_functions", None) is None:
+            from .natural_segment import NaturalSegment  # Imported here to prevent from circular imports
+
+            Q_sym = NaturalCoordinates.sym(self.nb_segments)
+            Qdot_sym = NaturalVelocities.sym(self.nb_segments)
+
+            # all segments share the same constraint structure, so the parameterized kernels are traced once
+            # and mapped across segments: the batched inputs are the (12, nb_segments) coordinate matrix and
+            # the (4, nb_segments) parameter matrix. The concatenations keep the block sparsity explicit and
+            # the expand() below inlines the mapped calls into one SX graph.
+            nb_segments = self.nb_segments
+            kernels = NaturalSegment.rigid_body_constraint_kernels()
+            Q_matrix = reshape(Q_sym, 12, nb_segments)
+            Qdot_matrix = reshape(Qdot_sym, 12, nb_segments)
+            parameters = horzcat(*[segment.rigid_body_constraint_parameters for _, _, _, segment in self.segment_cache])
+
+            Phi_r = reshape(kernels["constraint"].map(nb_segments)(Q_matrix, parameters), 6 * nb_segments, 1)
+            Phi_r_dot = reshape(
+                kernels["constraint_derivative"].map(nb_segments)(Q_matrix, Qdot_matrix), 6 * nb_segments, 1
+            )
+            K_r = diagcat(*horzsplit(kernels["constraint_jacobian"].map(nb_segments)(Q_matrix), 12))
+            Kr_dot = diagcat(*horzsplit(kernels["constraint_jacobian_derivative"].map(nb_segments)(Qdot_matrix), 12))
+
+            # expand() re-traces the MX graphs into SX, whose scalar representation evaluates faster
+            # and exposes every operation to casadi's common-subexpression elimination
+            options = function_options(getattr(self, "use_jit", False))
+            self._constraints_functions = dict(
+                rigid_body_constraints=Function("rigid_body_constraints", [Q_sym], [Phi_r]).expand(
+                    "rigid_body_constraints", options
+                ),
+                rigid_body_constraints_derivative=Function(
+                    "rigid_body_constraints_derivative", [Q_sym, Qdot_sym], [Phi_r_dot]
+                ).expand("rigid_body_constraints_derivative", options),
+                rigid_body_constraints_jacobian=Function("rigid_body_constraints_jacobian", [Q_sym], [K_r]).expand(
+                    "rigid_body_constraints_jacobian", options
+                ),
+                rigid_body_constraint_jacobian_derivative=Function(
+                    "rigid_body_constraint_jacobian_derivative", [Qdot_sym], [Kr_dot]
+                ).expand("rigid_body_constraint_jacobian_derivative", options),
+            )
+        return self._constraints_functions
+
+    def rigid_body_constraints_jacobian_sparsity(self) -> Sparsity:
+        """
+        This function returns the sparsity pattern of the rigid body constraints jacobian K_r, which is
+        block-diagonal with dense 6 x 12 blocks. The cached Function already carries this pattern, so
+        downstream solvers receiving it allocate 72 * nb_segments nonzeros instead of a dense matrix.
+
+        Returns
+        -------
+        Sparsity
+            The sparsity pattern of the jacobian [6 * nb_segments, 12 * nb_segments]
+        """
+        return self.constraints_functions["rigid_body_constraints_jacobian"].sparsity_out(0)
 
     def rigid_body_constraints(self, Q: NaturalCoordinates) -> MX:
         """
@@ -34,12 +108,7 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Rigid body constraints of the segment [6 * nb_segments, 1]
         """
 
-        Phi_r = MX.zeros(6 * self.nb_segments)
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx = slice(6 * i, 6 * (i + 1))
-            Phi_r[idx] = segment.rigid_body_constraint(Q.vector(i))
-
-        return Phi_r
+        return self.constraints_functions["rigid_body_constraints"](Q)
 
     def rigid_body_constraints_derivative(self, Q: NaturalCoordinates, Qdot: NaturalCoordinates) -> MX:
         """
@@ -52,12 +121,7 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Derivative of the rigid body constraints of the segment [6 * nb_segments, 1]
         """
 
-        Phi_r_dot = MX.zeros(6 * self.nb_segments)
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx = slice(6 * i, 6 * (i + 1))
-            Phi_r_dot[idx] = segment.rigid_body_constraint_derivative(Q.vector(i), Qdot.vector(i))
-
-        return Phi_r_dot
+        return self.constraints_functions["rigid_body_constraints_derivative"](Q, Qdot)
 
     def rigid_body_constraints_jacobian(self, Q: NaturalCoordinates) -> MX:
         """
@@ -70,13 +134,7 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Rigid body constraints of the segment [6 * nb_segments, nbQ]
         """
 
-        K_r = MX.zeros((6 * self.nb_segments, Q.shape[0]))
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx_row = slice(6 * i, 6 * (i + 1))
-            idx_col = slice(12 * i, 12 * (i + 1))
-            K_r[idx_row, idx_col] = segment.rigid_body_constraint_jacobian(Q.vector(i))
-
-        return K_r
+        return self.constraints_functions["rigid_body_constraints_jacobian"](Q)
 
     def rigid_body_constraint_jacobian_derivative(self, Qdot: NaturalVelocities) -> MX:
         """
@@ -93,10 +151,4 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             The derivative of the Jacobian matrix of the rigid body constraints [6 * nb_segments, 12 * nb_segments]
         """
 
-        Kr_dot = MX.zeros((6 * self.nb_segments, Qdot.shape[0]))
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx_row = slice(6 * i, 6 * (i + 1))
-            idx_col = slice(12 * i, 12 * (i + 1))
-            Kr_dot[idx_row, idx_col] = segment.rigid_body_constraint_jacobian_derivative(Qdot.vector(i))
-
-        return Kr_dot
+        return self.constraints_functions["rigid_body_constraint_jacobian_derivative"](Qdot)
@@ -1,7 +1,7 @@
 from typing import Union, Tuple
 
 import numpy as np
-from casadi import MX
+from casadi import MX, Function
 from casadi import cos, transpose, vertcat, inv, dot, sum1, horzcat, solve
 
 from .homogenous_transform import HomogeneousTransform
@@ -109,6 +109,7 @@ class NaturalSegment(AbstractNaturalSegment):
 
         self._markers = NaturalSegmentMarkers()
         self._vectors = NaturalSegmentVectors()
+        self._rigid_body_constraint_functions = None
 
     def __repr__(self) -> str:
         return f"NaturalSegment(name={self.name!r}, index={self.index})"
@@ -343,6 +344,92 @@ class NaturalSegment(AbstractNaturalSegment):
 
         return SegmentNaturalCoordinates((u, rp, rd, w))
 
+    _rigid_body_constraint_kernels = None
+
+    @classmethod
+    def rigid_body_constraint_kernels(cls) -> dict:
+        """
+        This function returns casadi Functions evaluating the rigid body constraint quantities of any segment,
+        with the segment parameters [length, alpha, beta, gamma] as an extra input. All segments share the same
+        constraint structure, so these kernels are traced once per class and mapped across segments with
+        Function.map() by the model-level assemblers.
+
+        Returns
+        -------
+        dict[str, Function]
+            The parameterized casadi Functions of the rigid body constraint
+        """
+        if cls._rigid_body_constraint_kernels is None:
+            parameters_sym = MX.sym("segment_parameters", 4)  # [length, alpha, beta, gamma]
+            template = cls(
+                name="template",
+                length=parameters_sym[0],
+                alpha=parameters_sym[1],
+                beta=parameters_sym[2],
+                gamma=parameters_sym[3],
+            )
+            Qi_sym = SegmentNaturalCoordinates.sym()
+            Qdoti_sym = SegmentNaturalVelocities.sym()
+            cls._rigid_body_constraint_kernels = dict(
+                constraint=Function(
+                    "rigid_body_constraint", [Qi_sym, parameters_sym], [template.rigid_body_constraint(Qi_sym)]
+                ).expand(),
+                # the derivative and the jacobians do not depend on the segment parameters
+                constraint_derivative=Function(
+                    "rigid_body_constraint_derivative",
+                    [Qi_sym, Qdoti_sym],
+                    [template.rigid_body_constraint_derivative(Qi_sym, Qdoti_sym)],
+                ).expand(),
+                constraint_jacobian=Function(
+                    "rigid_body_constraint_jacobian", [Qi_sym], [template.rigid_body_constraint_jacobian(Qi_sym)]
+                ).expand(),
+                constraint_jacobian_derivative=Function(
+                    "rigid_body_constraint_jacobian_derivative",
+                    [Qdoti_sym],
+                    [template.rigid_body_constraint_jacobian_derivative(Qdoti_sym)],
+                ).expand(),
+            )
+        return cls._rigid_body_constraint_kernels
+
+    @property
+    def rigid_body_constraint_parameters(self) -> MX:
+        """This function returns the segment parameters [length, alpha, beta, gamma] expected by the rigid body constraint kernels"""
+        return vertcat(self.length, self.alpha, self.beta, self.gamma)
+
+    @property
+    def rigid_body_constraint_functions(self) -> dict:
+        """
+        This function returns the casadi Functions evaluating the rigid body constraint of the segment,
+        its derivative, its jacobian and the jacobian derivative. The symbolic graphs are traced once per
+        segment on first use, so the model-level assemblers call compiled Functions instead of retracing
+        the constraint expressions through Python.
+
+        Returns
+        -------
+        dict[str, Function]
+            The casadi Functions of the segment rigid body constraint
+        """
+        if getattr(self, "_rigid_body_constraint_functions", None) is None:
+            Qi_sym = SegmentNaturalCoordinates.sym()
+            Qdoti_sym = SegmentNaturalVelocities.sym()
+            self._rigid_body_constraint_functions = dict(
+                constraint=Function("rigid_body_constraint", [Qi_sym], [self.rigid_body_constraint(Qi_sym)]).expand(),
+                constraint_derivative=Function(
+                    "rigid_body_constraint_derivative",
+                    [Qi_sym, Qdoti_sym],
+                    [self.rigid_body_constraint_derivative(Qi_sym, Qdoti_sym)],
+                ).expand(),
+                constraint_jacobian=Function(
+                    "rigid_body_constraint_jacobian", [Qi_sym], [self.rigid_body_constraint_jacobian(Qi_sym)]
+                ).expand(),
+                constraint_jacobian_derivative=Function(
+                    "rigid_body_constraint_jacobian_derivative",
+                    [Qdoti_sym],
+                    [self.rigid_body_constraint_jacobian_derivative(Qdoti_sym)],
+                ).expand(),
+            )
+        return self._rigid_body_constraint_functions
+
     def rigid_body_constraint(self, Qi: Union[SegmentNaturalCoordinates, np.ndarray]) -> MX:
         """
         This function returns the rigid body constraints of the segment, denoted phi_r.
@@ -1,4 +1,4 @@
-from casadi import MX
+from casadi import MX, horzcat
 import numpy as np
 from ..protocols.natural_vector import AbstractNaturalVector
 from ..protocols.interpolation_matrix import AbstractInterpolationMatrix
@@ -56,11 +56,10 @@ class NaturalVector(AbstractNaturalVector, MX):
 
     def interpolate(self) -> MX:
         """This function converts the natural vector into the interpolation matrix"""
-        interpolation_matrix = MX.zeros((3, 12))
-        interpolation_matrix[0:3, 0:3] = self[0] * MX.eye(3)
-        interpolation_matrix[0:3, 3:6] = (1 + self[1]) * MX.eye(3)
-        interpolation_matrix[0:3, 6:9] = -self[1] * MX.eye(3)
-        interpolation_matrix[0:3, 9:12] = self[2] * MX.eye(3)
+        # a single horzcat of scaled identities instead of a zero-fill plus four slice assignments,
+        # so the graph is one structural concat node
+        eye3 = MX.eye(3)
+        interpolation_matrix = horzcat(self[0] * eye3, (1 + self[1]) * eye3, -self[1] * eye3, self[2] * eye3)
         return InterpolationMatrix(interpolation_matrix)
 
 
@@ -125,11 +124,13 @@ class InterpolationMatrix(AbstractInterpolationMatrix, MX):
     @classmethod
     def from_natural_vector(cls, natural_vector: NaturalVector):
         """This function converts the natural vector into the interpolation matrix"""
-        interpolation_matrix = MX.zeros((3, 12))
-        interpolation_matrix[0:3, 0:3] = natural_vector[0] * MX.eye(3)
-        interpolation_matrix[0:3, 3:6] = (1 + natural_vector[1]) * MX.eye(3)
-        interpolation_matrix[0:3, 6:9] = -natural_vector[1] * MX.eye(3)
-        interpolation_matrix[0:3, 9:12] = natural_vector[2] * MX.eye(3)
+        eye3 = MX.eye(3)
+        interpolation_matrix = horzcat(
+            natural_vector[0] * eye3,
+            (1 + natural_vector[1]) * eye3,
+            -natural_vector[1] * eye3,
+            natural_vector[2] * eye3,
+        )
         return cls(interpolation_matrix)
 
     @property
@@ -1,6 +1,27 @@
 from casadi import Function, MX
 
 
+def function_options(jit: bool = False) -> dict:
+    """
+    This function returns the options to pass to the constructors of the cached constraint Functions.
+    When jit is True, casadi compiles the function to native code through a system C compiler and loads
+    it via dlopen, which removes the virtual-machine interpretation overhead from every evaluation.
+
+    Parameters
+    ----------
+    jit: bool
+        If True, the Function will be jit-compiled
+
+    Returns
+    -------
+    dict
+        The options to pass to the casadi Function constructor
+    """
+    if jit:
+        return dict(jit=True, compiler="shell", jit_options=dict(flags=["-O3", "-march=native"]))
+    return {}
+
+
 def to_numeric_MX(mx: MX, expand: bool = False) -> MX:
     """
     This function is intended to be use to convert a casadi MX to a numeric casadi MX.
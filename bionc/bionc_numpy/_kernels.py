@@ -0,0 +1,148 @@
+import numpy as np
+from numba import float64, void
+from numba import njit, prange
+
+
+@njit(void(float64[:], float64[:, :], float64[:]), parallel=True, cache=True)
+def assemble_rigid_body_constraints(Q: np.ndarray, offsets: np.ndarray, phi_r: np.ndarray) -> None:
+    """
+    This function assembles the rigid body constraints of all segments, denoted Phi_r, in one compiled pass.
+
+    Parameters
+    ----------
+    Q : np.ndarray
+        The flat natural coordinates of the model [12 * nb_segments]
+    offsets : np.ndarray
+        The constant part of each constraint [1, L cos(gamma), cos(beta), L**2, L cos(alpha), 1]
+        stacked column-wise [6 x nb_segments]
+    phi_r : np.ndarray
+        Preallocated output, the rigid body constraints of the segments [6 * nb_segments]
+    """
+    nb_segments = offsets.shape[1]
+    for i in prange(nb_segments):
+        u = Q[12 * i : 12 * i + 3]
+        v = Q[12 * i + 3 : 12 * i + 6] - Q[12 * i + 6 : 12 * i + 9]
+        w = Q[12 * i + 9 : 12 * i + 12]
+
+        phi_r[6 * i + 0] = np.dot(u, u) - offsets[0, i]
+        phi_r[6 * i + 1] = np.dot(u, v) - offsets[1, i]
+        phi_r[6 * i + 2] = np.dot(u, w) - offsets[2, i]
+        phi_r[6 * i + 3] = np.dot(v, v) - offsets[3, i]
+        phi_r[6 * i + 4] = np.dot(v, w) - offsets[4, i]
+        phi_r[6 * i + 5] = np.dot(w, w) - offsets[5, i]
+
+
+@njit(void(float64[:], float64[:], float64[:]), parallel=True, cache=True)
+def assemble_rigid_body_constraints_derivative(Q: np.ndarray, Qdot: np.ndarray, phi_r_dot: np.ndarray) -> None:
+    """
+    This function assembles the derivative of the rigid body constraints of all segments, denoted Phi_r_dot,
+    in one compiled pass.
+
+    Parameters
+    ----------
+    Q : np.ndarray
+        The flat natural coordinates of the model [12 * nb_segments]
+    Qdot : np.ndarray
+        The flat natural velocities of the model [12 * nb_segments]
+    phi_r_dot : np.ndarray
+        Preallocated output, the derivative of the rigid body constraints of the segments [6 * nb_segments]
+    """
+    nb_segments = Q.shape[0] // 12
+    for i in prange(nb_segments):
+        u = Q[12 * i : 12 * i + 3]
+        v = Q[12 * i + 3 : 12 * i + 6] - Q[12 * i + 6 : 12 * i + 9]
+        w = Q[12 * i + 9 : 12 * i + 12]
+        udot = Qdot[12 * i : 12 * i + 3]
+        vdot = Qdot[12 * i + 3 : 12 * i + 6] - Qdot[12 * i + 6 : 12 * i + 9]
+        wdot = Qdot[12 * i + 9 : 12 * i + 12]
+
+        phi_r_dot[6 * i + 0] = 2.0 * np.dot(u, udot)
+        phi_r_dot[6 * i + 1] = np.dot(udot, v) + np.dot(u, vdot)
+        phi_r_dot[6 * i + 2] = np.dot(udot, w) + np.dot(u, wdot)
+        phi_r_dot[6 * i + 3] = 2.0 * np.dot(v, vdot)
+        phi_r_dot[6 * i + 4] = np.dot(vdot, w) + np.dot(v, wdot)
+        phi_r_dot[6 * i + 5] = 2.0 * np.dot(w, wdot)
+
+
+@njit(void(float64[:], float64[:, :]), parallel=True, cache=True)
+def assemble_rigid_body_constraints_jacobian(Q: np.ndarray, K_r: np.ndarray) -> None:
+    """
+    This function assembles the Jacobian matrix of the rigid body constraints of all segments, denoted K_r,
+    in one compiled pass. Only the block-diagonal 6 x 12 blocks are written, so the preallocated output
+    must keep its off-diagonal blocks zero.
+
+    Parameters
+    ----------
+    Q : np.ndarray
+        The flat natural coordinates of the model [12 * nb_segments]
+    K_r : np.ndarray
+        Preallocated output, the Jacobian matrix of the rigid body constraints
+        [6 * nb_segments x 12 * nb_segments]
+    """
+    nb_segments = Q.shape[0] // 12
+    for i in prange(nb_segments):
+        u = Q[12 * i : 12 * i + 3]
+        v = Q[12 * i + 3 : 12 * i + 6] - Q[12 * i + 6 : 12 * i + 9]
+        w = Q[12 * i + 9 : 12 * i + 12]
+        row = 6 * i
+        col = 12 * i
+
+        K_r[row + 0, col : col + 3] = 2.0 * u
+
+        K_r[row + 1, col : col + 3] = v
+        K_r[row + 1, col + 3 : col + 6] = u
+        K_r[row + 1, col + 6 : col + 9] = -u
+
+        K_r[row + 2, col : col + 3] = w
+        K_r[row + 2, col + 9 : col + 12] = u
+
+        K_r[row + 3, col + 3 : col + 6] = 2.0 * v
+        K_r[row + 3, col + 6 : col + 9] = -2.0 * v
+
+        K_r[row + 4, col + 3 : col + 6] = w
+        K_r[row + 4, col + 6 : col + 9] = -w
+        K_r[row + 4, col + 9 : col + 12] = v
+
+        K_r[row + 5, col + 9 : col + 12] = 2.0 * w
+
+
+@njit(void(float64[:], float64[:, :]), parallel=True, cache=True)
+def assemble_rigid_body_constraints_jacobian_derivative(Qdot: np.ndarray, Kr_dot: np.ndarray) -> None:
+    """
+    This function assembles the derivative of the Jacobian matrix of the rigid body constraints of all segments,
+    denoted Kr_dot, in one compiled pass. Only the block-diagonal 6 x 12 blocks are written, so the
+    preallocated output must keep its off-diagonal blocks zero.
+
+    Parameters
+    ----------
+    Qdot : np.ndarray
+        The flat natural velocities of the model [12 * nb_segments]
+    Kr_dot : np.ndarray
+        Preallocated output, the derivative of the Jacobian matrix of the rigid body constraints
+        [6 * nb_segments x 12 * nb_segments]
+    """
+    nb_segments = Qdot.shape[0] // 12
+    for i in prange(nb_segments):
+        udot = Qdot[12 * i : 12 * i + 3]
+        vdot = Qdot[12 * i + 3 : 12 * i + 6] - Qdot[12 * i + 6 : 12 * i + 9]
+        wdot = Qdot[12 * i + 9 : 12 * i + 12]
+        row = 6 * i
+        col = 12 * i
+
+        Kr_dot[row + 0, col : col + 3] = 2.0 * udot
+
+        Kr_dot[row + 1, col : col + 3] = vdot
+        Kr_dot[row + 1, col + 3 : col + 6] = udot
+        Kr_dot[row + 1, col + 6 : col + 9] = -udot
+
+        Kr_dot[row + 2, col : col + 3] = wdot
+        Kr_dot[row + 2, col + 9 : col + 12] = udot
+
+        Kr_dot[row + 3, col + 3 : col + 6] = 2.0 * vdot
+        Kr_dot[row + 3, col + 6 : col + 9] = -2.0 * vdot
+
+        Kr_dot[row + 4, col + 3 : col + 6] = wdot
+        Kr_dot[row + 4, col + 6 : col + 9] = -wdot
+        Kr_dot[row + 4, col + 9 : col + 12] = vdot
+
+        Kr_dot[row + 5, col + 9 : col + 12] = 2.0 * wdot
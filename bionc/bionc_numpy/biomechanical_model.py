@@ -2,6 +2,7 @@ from typing import Any
 
 import numpy as np
 from numpy import transpose
+from scipy import sparse
 
 from .biomechanical_model_joints import BiomechanicalModelJoints
 from .biomechanical_model_markers import BiomechanicalModelMarkers
@@ -78,17 +79,87 @@ class BiomechanicalModel(GenericBiomechanicalModel):
         np.ndarray
             generalized mass matrix of the segment [12 * nbSegment x 12 * * nbSegment]
         """
+        cache = self.segments.segment_cache
+        previous = getattr(self, "_mass_matrix", None)
+        if (
+            previous is not None
+            and getattr(self, "_potential_energy_row", None) is not None
+            and previous.shape[0] == 12 * (len(cache) - 1)
+        ):
+            # only one segment was appended since the last update: grow the block diagonal by one
+            # 12 x 12 block instead of rebuilding every block, keeping model construction O(N)
+            _, _, idx, segment = cache[-1]
+            Gi = segment.mass_matrix
+            if Gi is not None:
+                nb_segments = len(cache)
+                G = np.zeros((12 * nb_segments, 12 * nb_segments))
+                G[: previous.shape[0], : previous.shape[1]] = previous
+                G[idx, idx] = Gi
+                self._mass_matrix = G
+                self._sparse_mass_matrix = sparse.bsr_matrix(
+                    (
+                        np.concatenate((self._sparse_mass_matrix.data, Gi[np.newaxis])),
+                        np.arange(nb_segments),
+                        np.arange(nb_segments + 1),
+                    ),
+                    shape=(12 * nb_segments, 12 * nb_segments),
+                )
+                self._potential_energy_row = np.concatenate(
+                    (
+                        self._potential_energy_row,
+                        segment.mass * np.asarray(segment.natural_center_of_mass.interpolate())[2, :],
+                    )
+                )
+                return
+
         G = np.zeros((12 * self.nb_segments, 12 * self.nb_segments))
-        for i, segment in enumerate(self.segments_no_ground.values()):
+        for i, _, idx, segment in self.segments.segment_cache:
             Gi = segment.mass_matrix
             if Gi is None:
                 # mass matrix is None if one the segment doesn't have any inertial properties
                 self._mass_matrix = None
+                self._sparse_mass_matrix = None
+                self._potential_energy_row = None
                 return
-            idx = slice(12 * i, 12 * (i + 1))
-            G[idx, idx] = segment.mass_matrix
+            G[idx, idx] = Gi
 
         self._mass_matrix = G
+        # the potential energy is linear in Q: sum_i m_i * (N_com_i @ Q_i)[2]. Stacking the weighted
+        # z-rows of the center of mass interpolation matrices turns it into a single dot product
+        self._potential_energy_row = np.concatenate(
+            [
+                segment.mass * np.asarray(segment.natural_center_of_mass.interpolate())[2, :]
+                for _, _, _, segment in self.segments.segment_cache
+            ]
+            or [np.zeros(0)]
+        )
+        # the only nonzeros of G are the 12 x 12 diagonal blocks, so the block sparse row format stores
+        # and multiplies them in O(nb_segments) instead of O(nb_segments**2) for the dense matrix
+        nb_segments = self.nb_segments
+        if nb_segments == 0:
+            self._sparse_mass_matrix = sparse.bsr_matrix(G)
+            return
+        self._sparse_mass_matrix = sparse.bsr_matrix(
+            (
+                np.stack([segment.mass_matrix for _, _, _, segment in self.segments.segment_cache]),
+                np.arange(nb_segments),
+                np.arange(nb_segments + 1),
+            ),
+            shape=(12 * nb_segments, 12 * nb_segments),
+        )
+
+    @property
+    def sparse_mass_matrix(self) -> "sparse.bsr_matrix":
+        """
+        This function returns the generalized mass matrix of the system as a block sparse row matrix
+        with 12 x 12 diagonal blocks, for O(nb_segments) products with natural velocity vectors.
+
+        Returns
+        -------
+        sparse.bsr_matrix
+            The sparse generalized mass matrix of the system [12 * nb_segments x 12 * nb_segments]
+        """
+        return self._sparse_mass_matrix
 
     def kinetic_energy(self, Qdot: NaturalVelocities) -> float:
         """
@@ -105,7 +176,10 @@ class BiomechanicalModel(GenericBiomechanicalModel):
             The kinetic energy of the system
         """
 
-        return 0.5 * transpose(Qdot.to_array()) @ self._mass_matrix @ Qdot.to_array()
+        if getattr(self, "_sparse_mass_matrix", None) is None:
+            self._update_mass_matrix()  # for models serialized before the sparse form existed
+
+        return 0.5 * transpose(Qdot.to_array()) @ (self._sparse_mass_matrix @ Qdot.to_array())
 
     def potential_energy(self, Q: NaturalCoordinates) -> np.ndarray | float:
         """
@@ -121,11 +195,17 @@ class BiomechanicalModel(GenericBiomechanicalModel):
         float
             The potential energy of the system
         """
-        E = 0
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            E += segment.potential_energy(Q.vector(i))
+        if getattr(self, "_potential_energy_row", None) is None:
+            self._update_mass_matrix()  # for models serialized before the stacked form existed
+
+        if self._potential_energy_row is None:
+            # at least one segment has no inertial properties, keep the per-segment evaluation
+            E = 0
+            for i, segment in enumerate(self.segments_no_ground.values()):
+                E += segment.potential_energy(Q.vector(i))
+            return E
 
-        return E
+        return self._potential_energy_row @ np.asarray(Q, dtype=np.float64).ravel()
 
     def lagrangian(self, Q: NaturalCoordinates, Qdot: NaturalVelocities) -> np.ndarray | float:
         """
@@ -357,9 +437,22 @@ class BiomechanicalModel(GenericBiomechanicalModel):
         """
         G = self.mass_matrix
         K = self.holonomic_constraints_jacobian(Q)
-        upper_augmented_mass_matrix = np.concatenate((G, K.T), axis=1)
-        lower_augmented_mass_matrix = np.concatenate((K, np.zeros((K.shape[0], K.shape[0]))), axis=1)
-        return np.concatenate((upper_augmented_mass_matrix, lower_augmented_mass_matrix), axis=0)
+        nb_Q = G.shape[0]
+        nb_constraints = K.shape[0]
+
+        # the augmented matrix is assembled into a persistent buffer: the mass block is constant
+        # per model and the zero block never changes, so each call only rewrites the two jacobian
+        # blocks instead of concatenating the full matrix from scratch
+        buffer = getattr(self, "_augmented_mass_matrix_buffer", None)
+        token = getattr(self, "_augmented_mass_matrix_token", None)
+        if buffer is None or buffer.shape[0] != nb_Q + nb_constraints or token is not G:
+            buffer = np.zeros((nb_Q + nb_constraints, nb_Q + nb_constraints))
+            buffer[:nb_Q, :nb_Q] = G
+            self._augmented_mass_matrix_buffer = buffer
+            self._augmented_mass_matrix_token = G
+        buffer[:nb_Q, nb_Q:] = K.T
+        buffer[nb_Q:, :nb_Q] = K
+        return buffer
 
     def forward_dynamics(
         self,
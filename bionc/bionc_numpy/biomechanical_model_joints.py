@@ -1,14 +1,50 @@
 import numpy as np
 from typing import Any
 
-from .natural_coordinates import NaturalCoordinates
-from .natural_velocities import NaturalVelocities
+from .natural_coordinates import NaturalCoordinates, SegmentNaturalCoordinates
+from .natural_velocities import NaturalVelocities, SegmentNaturalVelocities
 from ..protocols.biomechanical_model_joints import GenericBiomechanicalModelJoints
 
 
 class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
     def __init__(self, joints: dict[str, Any] = None):
         super().__init__(joints=joints)
+        self._output_buffers = None
+
+    def _invalidate_joint_cache(self):
+        super()._invalidate_joint_cache()
+        self._output_buffers = None
+
+    @property
+    def joint_factories(self) -> dict:
+        from .enums import JOINT_FACTORIES  # Imported here to prevent from circular imports
+
+        return JOINT_FACTORIES
+
+    def output_buffers(self, nb_Q: int) -> dict:
+        """
+        This function returns the preallocated output arrays of the joint constraint assemblers, allocated
+        once per model mutation and overwritten on every call. The jacobian buffers are zeroed once and only
+        the parent and child column blocks of each joint are rewritten afterwards, since the other columns
+        stay zero.
+
+        Parameters
+        ----------
+        nb_Q : int
+            The number of natural coordinates of the model [12 * nb_segments]
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The preallocated output arrays, reused across calls
+        """
+        if getattr(self, "_output_buffers", None) is None or self._output_buffers["K_k"].shape[1] != nb_Q:
+            self._output_buffers = dict(
+                phi_k=np.zeros(self.nb_constraints),
+                K_k=np.zeros((self.nb_constraints, nb_Q)),
+                K_k_dot=np.zeros((self.nb_constraints, nb_Q)),
+            )
+        return self._output_buffers
 
     def constraints(self, Q: NaturalCoordinates) -> np.ndarray:
         """
@@ -26,15 +62,16 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             Joint constraints of the segment [nb_joint_constraints, 1]
         """
 
-        Phi_k = np.zeros(self.nb_constraints)
-
-        for joint_name, joint in self.joints_with_constraints.items():
-            constraint_slice = self.constraints_index(joint.index)
+        Phi_k = self.output_buffers(Q.shape[0])["phi_k"]
 
+        # basic slicing on the underlying array gives views of the coordinate blocks
+        # instead of the copies made by Q.vector(i)
+        Q_array = np.asarray(Q)
+        for joint, constraint_slice, parent_index, child_index in self.joint_cache:
             Q_parent = (
-                None if joint.parent is None else Q.vector(joint.parent.index)
+                None if parent_index is None else SegmentNaturalCoordinates(Q_array[joint.parent.coordinates_slice])
             )  # if the joint is a joint with the ground, the parent is None
-            Q_child = Q.vector(joint.child.index)
+            Q_child = SegmentNaturalCoordinates(Q_array[joint.child.coordinates_slice])
 
             Phi_k[constraint_slice] = joint.constraint(Q_parent, Q_child)
 
@@ -56,23 +93,23 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             Joint constraints of the segment [nb_joint_constraints, nbQ]
         """
 
-        K_k = np.zeros((self.nb_constraints, Q.shape[0]))
-
-        for joint_name, joint in self.joints_with_constraints.items():
-            idx_row = self.constraints_index(joint.index)
-
-            idx_col_child = joint.child.coordinates_slice
-            idx_col_parent = joint.parent.coordinates_slice if joint.parent is not None else None
+        K_k = self.output_buffers(Q.shape[0])["K_k"]
 
+        Q_array = np.asarray(Q)
+        for joint, idx_row, parent_index, child_index in self.joint_cache:
             Q_parent = (
-                None if joint.parent is None else Q.vector(joint.parent.index)
+                None if parent_index is None else SegmentNaturalCoordinates(Q_array[joint.parent.coordinates_slice])
             )  # if the joint is a joint with the ground, the parent is None
-            Q_child = Q.vector(joint.child.index)
+            Q_child = SegmentNaturalCoordinates(Q_array[joint.child.coordinates_slice])
 
-            if joint.parent is not None:  # If the joint is not a ground joint
-                K_k[idx_row, idx_col_parent] = joint.parent_constraint_jacobian(Q_parent, Q_child)
-
-            K_k[idx_row, idx_col_child] = joint.child_constraint_jacobian(Q_parent, Q_child)
+            if parent_index is not None:  # If the joint is not a ground joint
+                # the fused call computes both blocks in one dispatch, the scatter into
+                # disjoint row and column ranges needs no synchronization
+                K_k_parent, K_k_child = joint.constraint_jacobian(Q_parent, Q_child)
+                K_k[idx_row, joint.parent.coordinates_slice] = K_k_parent
+                K_k[idx_row, joint.child.coordinates_slice] = K_k_child
+            else:
+                K_k[idx_row, joint.child.coordinates_slice] = joint.child_constraint_jacobian(Q_parent, Q_child)
 
         return K_k
 
@@ -91,21 +128,21 @@ class BiomechanicalModelJoints(GenericBiomechanicalModelJoints):
             The derivative of the Jacobian matrix of the joint constraints [nb_joint_constraints, 12 * nb_segments]
         """
 
-        K_k_dot = np.zeros((self.nb_constraints, Qdot.shape[0]))
-        for joint_name, joint in self.joints_with_constraints.items():
-            idx_row = self.constraints_index(joint.index)
-
-            idx_col_child = joint.child.coordinates_slice
-            idx_col_parent = joint.parent.coordinates_slice if joint.parent is not None else None
-
+        K_k_dot = self.output_buffers(Qdot.shape[0])["K_k_dot"]
+        Qdot_array = np.asarray(Qdot)
+        for joint, idx_row, parent_index, child_index in self.joint_cache:
             Qdot_parent = (
-                None if joint.parent is None else Qdot.vector(joint.parent.index)
+                None if parent_index is None else SegmentNaturalVelocities(Qdot_array[joint.parent.coordinates_slice])
             )  # if the joint is a joint with the ground, the parent is None
-            Qdot_child = Qdot.vector(joint.child.index)
-
-            if joint.parent is not None:  # If the joint is not a ground joint
-                K_k_dot[idx_row, idx_col_parent] = joint.parent_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
-
-            K_k_dot[idx_row, idx_col_child] = joint.child_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
+            Qdot_child = SegmentNaturalVelocities(Qdot_array[joint.child.coordinates_slice])
+
+            if parent_index is not None:  # If the joint is not a ground joint
+                K_k_parent_dot, K_k_child_dot = joint.constraint_jacobian_derivative(Qdot_parent, Qdot_child)
+                K_k_dot[idx_row, joint.parent.coordinates_slice] = K_k_parent_dot
+                K_k_dot[idx_row, joint.child.coordinates_slice] = K_k_child_dot
+            else:
+                K_k_dot[idx_row, joint.child.coordinates_slice] = joint.child_constraint_jacobian_derivative(
+                    Qdot_parent, Qdot_child
+                )
 
         return K_k_dot
@@ -1,6 +1,13 @@
 import numpy as np
+from scipy import sparse
 from typing import Any
 
+from ._kernels import (
+    assemble_rigid_body_constraints,
+    assemble_rigid_body_constraints_derivative,
+    assemble_rigid_body_constraints_jacobian,
+    assemble_rigid_body_constraints_jacobian_derivative,
+)
 from .natural_coordinates import NaturalCoordinates
 from .natural_velocities import NaturalVelocities
 from ..protocols.biomechanical_model import GenericBiomechanicalModelSegments
@@ -22,6 +29,86 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
         segments: dict[str:Any, ...] = None,
     ):
         super().__init__(segments=segments)
+        self._segment_parameters = None
+        self._output_buffers = None
+
+    def _invalidate_segment_cache(self):
+        super()._invalidate_segment_cache()
+        self._segment_parameters = None
+        self._output_buffers = None
+
+    @property
+    def output_buffers(self) -> dict:
+        """
+        This function returns the preallocated output arrays of the constraint assemblers, allocated once
+        per model mutation and overwritten on every call. The jacobian buffers are zeroed once and only their
+        block-diagonal 6 x 12 blocks are rewritten afterwards, since the off-diagonal blocks stay zero.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            The preallocated output arrays, reused across calls
+        """
+        if getattr(self, "_output_buffers", None) is None:
+            nb_segments = self.nb_segments
+            self._output_buffers = dict(
+                phi_r=np.zeros(6 * nb_segments),
+                phi_r_dot=np.zeros(6 * nb_segments),
+                K_r=np.zeros((6 * nb_segments, 12 * nb_segments)),
+                Kr_dot=np.zeros((6 * nb_segments, 12 * nb_segments)),
+            )
+        return self._output_buffers
+
+    @property
+    def segment_parameters(self) -> np.ndarray:
+        """
+        This function returns the constant part of each rigid body constraint,
+        [1, L cos(gamma), cos(beta), L**2, L cos(alpha), 1], stacked column-wise in structure-of-arrays form.
+        The trigonometric terms only depend on the segment geometry, so they are evaluated once per model
+        mutation instead of on every constraint call.
+
+        Returns
+        -------
+        np.ndarray
+            The rigid body constraint offsets [6 x nb_segments]
+        """
+        if getattr(self, "_segment_parameters", None) is None:
+            self._segment_parameters = np.array(
+                [
+                    [
+                        1.0,
+                        float(segment.length) * np.cos(float(segment.gamma)),
+                        np.cos(float(segment.beta)),
+                        float(segment.length) ** 2,
+                        float(segment.length) * np.cos(float(segment.alpha)),
+                        1.0,
+                    ]
+                    for _, _, _, segment in self.segment_cache
+                ]
+            ).T
+        return self._segment_parameters
+
+    def rigid_body_constraints_jacobian_sparsity(self) -> "sparse.csr_matrix":
+        """
+        This function returns the sparsity pattern of the rigid body constraints jacobian K_r, which is
+        block-diagonal with dense 6 x 12 blocks. Passing it to sparsity-aware solvers
+        (e.g. scipy.optimize.least_squares or IPOPT) lets them allocate 72 * nb_segments nonzeros
+        instead of a dense matrix.
+
+        Returns
+        -------
+        sparse.csr_matrix
+            The sparsity pattern of the jacobian [6 * nb_segments, 12 * nb_segments], ones on the nonzeros
+        """
+        nb_segments = self.nb_segments
+        return sparse.bsr_matrix(
+            (
+                np.ones((nb_segments, 6, 12)),
+                np.arange(nb_segments),
+                np.arange(nb_segments + 1),
+            ),
+            shape=(6 * nb_segments, 12 * nb_segments),
+        ).tocsr()
 
     def rigid_body_constraints(self, Q: NaturalCoordinates) -> np.ndarray:
         """
@@ -34,10 +121,10 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Rigid body constraints of the segment [6 * nb_segments, 1]
         """
 
-        Phi_r = np.zeros(6 * self.nb_segments)
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx = slice(6 * i, 6 * (i + 1))
-            Phi_r[idx] = segment.rigid_body_constraint(Q.vector(i))
+        Phi_r = self.output_buffers["phi_r"]
+        assemble_rigid_body_constraints(
+            np.ascontiguousarray(Q, dtype=np.float64).ravel(), self.segment_parameters, Phi_r
+        )
 
         return Phi_r
 
@@ -52,10 +139,12 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Derivative of the rigid body constraints of the segment [6 * nb_segments, 1]
         """
 
-        Phi_r_dot = np.zeros(6 * self.nb_segments)
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx = slice(6 * i, 6 * (i + 1))
-            Phi_r_dot[idx] = segment.rigid_body_constraint_derivative(Q.vector(i), Qdot.vector(i))
+        Phi_r_dot = self.output_buffers["phi_r_dot"]
+        assemble_rigid_body_constraints_derivative(
+            np.ascontiguousarray(Q, dtype=np.float64).ravel(),
+            np.ascontiguousarray(Qdot, dtype=np.float64).ravel(),
+            Phi_r_dot,
+        )
 
         return Phi_r_dot
 
@@ -70,11 +159,8 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             Rigid body constraints of the segment [6 * nb_segments, nbQ]
         """
 
-        K_r = np.zeros((6 * self.nb_segments, Q.shape[0]))
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx_row = slice(6 * i, 6 * (i + 1))
-            idx_col = slice(12 * i, 12 * (i + 1))
-            K_r[idx_row, idx_col] = segment.rigid_body_constraint_jacobian(Q.vector(i))
+        K_r = self.output_buffers["K_r"]
+        assemble_rigid_body_constraints_jacobian(np.ascontiguousarray(Q, dtype=np.float64).ravel(), K_r)
 
         return K_r
 
@@ -93,10 +179,9 @@ class BiomechanicalModelSegments(GenericBiomechanicalModelSegments):
             The derivative of the Jacobian matrix of the rigid body constraints [6, 12]
         """
 
-        Kr_dot = np.zeros((6 * self.nb_segments, Qdot.shape[0]))
-        for i, segment in enumerate(self.segments_no_ground.values()):
-            idx_row = slice(6 * i, 6 * (i + 1))
-            idx_col = slice(12 * i, 12 * (i + 1))
-            Kr_dot[idx_row, idx_col] = segment.rigid_body_constraint_jacobian_derivative(Qdot.vector(i))
+        Kr_dot = self.output_buffers["Kr_dot"]
+        assemble_rigid_body_constraints_jacobian_derivative(
+            np.ascontiguousarray(Qdot, dtype=np.float64).ravel(), Kr_dot
+        )
 
         return Kr_dot
@@ -26,6 +26,11 @@ class JointType(Enum):
     # PLANAR = "planar"
 
 
+# straight dict dispatch on the member name, so hot model-building loops resolve the joint factory
+# with one lookup instead of going through the enum descriptor machinery
+JOINT_FACTORIES: dict[str, type] = {name: member.value for name, member in JointType.__members__.items()}
+
+
 class InitialGuessModeType(Enum):
     FROM_CURRENT_MARKERS = "FromCurrentMarkers"
     USER_PROVIDED = "UserProvided"
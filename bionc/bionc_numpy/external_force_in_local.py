@@ -107,13 +107,17 @@ class ExternalForceInLocal:
         ExternalForceInGlobalOnProximal
             The external force on the proximal point of the segment
         """
-        qi_array = np.array(Qi).squeeze()
+        qi_array = np.asarray(Qi).ravel()
 
-        old_point_interpolation_matrix = NaturalVector(self.application_point_in_local).interpolate()
-        new_point_interpolation_matrix = NaturalVector.proximal().interpolate()
+        # the application point is fixed in the segment frame, so its interpolation matrix is
+        # built once per force and cached; the proximal point needs no matrix, its position is rp
+        interpolation_matrix = getattr(self, "_interpolation_matrix_cache", None)
+        if interpolation_matrix is None:
+            interpolation_matrix = np.asarray(NaturalVector(self.application_point_in_local).interpolate())
+            self._interpolation_matrix_cache = interpolation_matrix
 
-        old_application_point_in_global = np.array(old_point_interpolation_matrix @ qi_array).squeeze()
-        new_application_point_in_global = np.array(new_point_interpolation_matrix @ qi_array).squeeze()
+        old_application_point_in_global = interpolation_matrix @ qi_array
+        new_application_point_in_global = qi_array[3:6]
 
         # Bour's formula to transport the moment from the application point to the new application point
         lever_arm = new_application_point_in_global - old_application_point_in_global
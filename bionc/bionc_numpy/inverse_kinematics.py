@@ -1,15 +1,21 @@
+import hashlib
 import numpy as np
-from casadi import vertcat, horzcat, MX, Function, sum1
+import os
+import subprocess
+import tempfile
+from casadi import vertcat, horzcat, vec, MX, Function, nlpsol, sum1, cse
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
 from typing import Callable
 
 from .enums import InitialGuessModeType
 from .time_series_utils import TimeSeriesUtils
-from ..bionc_casadi import NaturalCoordinates, SegmentNaturalCoordinates
-from ..bionc_numpy.natural_coordinates import NaturalCoordinates as NaturalCoordinatesNumpy
+from ..bionc_casadi import NaturalCoordinates
 from ..protocols.biomechanical_model import GenericBiomechanicalModel as BiomechanicalModel
 from ..utils import constants
 from ..utils.c3d_ik_exporter import C3DInverseKinematicsExporter
-from ..utils.casadi_utils import _mx_to_sx, _solve_nlp, sarrus
+from ..utils.casadi_utils import _mx_to_sx, best_ipopt_linear_solver
 from ..utils.heatmap_helpers import (
     check_format_experimental_heatmaps,
     compute_total_confidence,
@@ -18,6 +24,38 @@ from ..utils.heatmap_timeseries_helpers import HeatmapTimeseriesHelpers, subset_
 from ..utils.markers_check_import import load_and_validate_markers
 
 
+def _limit_worker_threads():
+    """Keeps each worker process on one BLAS thread to avoid oversubscribing the cores"""
+    os.environ["OMP_NUM_THREADS"] = "1"
+
+
+def _solve_frame_chunk(
+    serialized_nlp: str,
+    method: str,
+    options: dict,
+    Q_init_chunk: np.ndarray,
+    parameters_chunk: list[np.ndarray],
+    lbg: np.ndarray,
+    ubg: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, list[bool]]:
+    """
+    Solves a contiguous chunk of frames in a worker process. Each worker receives the symbolic
+    nlp as a serialized casadi Function and constructs its own solver from it: a solver built
+    in the parent process does not survive the trip into a worker.
+    """
+    solver = nlpsol("InverseKinematics", method, Function.deserialize(serialized_nlp), options)
+    nb_chunk_frames = Q_init_chunk.shape[1]
+    Qopt_chunk = np.zeros((Q_init_chunk.shape[0], nb_chunk_frames))
+    objectives = np.zeros(nb_chunk_frames)
+    successes = []
+    for f in range(nb_chunk_frames):
+        r = solver(x0=Q_init_chunk[:, f], p=parameters_chunk[f], lbg=lbg, ubg=ubg)
+        Qopt_chunk[:, f] = np.asarray(r["x"]).reshape(-1)
+        objectives[f] = float(r["f"])
+        successes.append(solver.stats()["success"])
+    return Qopt_chunk, objectives, successes
+
+
 class InverseKinematics:
     """
     Inverse kinematics solver also known as Multibody Kinematics Optimization (MKO)
@@ -145,6 +183,13 @@ class InverseKinematics:
         self._initialize_dimensions()
         self._initialize_heatmap_attributes()
 
+        if self.experimental_markers is not None:
+            # flattened column-major so each frame of the parameter vector is one contiguous
+            # column instead of a strided slice copied on every solve
+            self._markers_flat = np.asfortranarray(
+                self.experimental_markers[:3, :, :].reshape((3 * self.nb_markers, self.nb_frames), order="F")
+            )
+
         self.Qopt = None
         self.segment_determinants = None
         self.success_optim = []
@@ -158,6 +203,12 @@ class InverseKinematics:
             self.camera_parameters = np.reshape(
                 self.experimental_heatmaps["camera_parameters"], (3 * 4, self.nb_cameras)
             )
+            self._camera_parameters_flat = self.camera_parameters.ravel(order="F")
+            self._gaussian_parameters_flat = np.asfortranarray(
+                self.gaussian_parameters.transpose(0, 2, 1).reshape(
+                    (5 * self.nb_markers * self.nb_cameras, self.nb_frames), order="F"
+                )
+            )
         else:
             self.gaussian_parameters = None
             self.camera_parameters = None
@@ -204,7 +255,14 @@ class InverseKinematics:
         This method updates the objective function of the inverse kinematics problem. It is called each time a new
         objective is added to the inverse kinematics problem.
         """
-        self._objective_function = Function(
+        # rebuilding is only needed when the terms actually changed, the graphs are immutable
+        # so the identity of the terms is enough as a key
+        key = tuple(id(term) for term in self.objective_sym)
+        if getattr(self, "_objective_sym_key", None) == key and self._objective_function is not None:
+            return
+        self._objective_sym_key = key
+
+        objective_function = Function(
             "objective_function",
             [
                 self._Q_sym,
@@ -213,7 +271,14 @@ class InverseKinematics:
                 self._gaussian_parameters_sym,
             ],
             [sum1(vertcat(*self.objective_sym))],
-        ).expand()
+        )
+        # when use_sx, the whole nlp is expanded to SX in _setup_nlp, so expanding here as well
+        # would only duplicate the MX-to-SX work; the expansion is kept for the pure MX path
+        # where it embeds a faster SX body in the call node
+        self._objective_function = objective_function if self.use_sx else objective_function.expand()
+        # the cached nlp and solver embed the previous objective, they have to be rebuilt
+        self._nlp_cache = None
+        self._solver_cache = None
 
     def add_objective(self, objective_function: Callable):
         """
@@ -262,6 +327,9 @@ class InverseKinematics:
         initial_guess_mode: InitialGuessModeType = InitialGuessModeType.FROM_CURRENT_MARKERS,
         method: str = "ipopt",
         options: dict = None,
+        jit: bool = False,
+        nb_processes: int = 1,
+        verbose: bool = False,
     ) -> np.ndarray:
         """
         Solves the inverse kinematics
@@ -278,6 +346,16 @@ class InverseKinematics:
             The method to use to solve the NLP (ipopt, sqpmethod, ...)
         options : dict
             The options to pass to the solver
+        jit : bool
+            If True, the NLP callbacks are compiled to native code with the shell compiler, which pays a
+            one-time compilation cost but speeds up every solver iteration afterwards
+        nb_processes : int
+            The number of worker processes the frames are distributed over, by default 1 (serial).
+            Processes are used rather than threads because the linear solvers of ipopt are not thread-safe.
+            Only available when the initial guess does not chain one frame to the next, i.e. with
+            InitialGuessModeType.FROM_CURRENT_MARKERS or InitialGuessModeType.USER_PROVIDED.
+        verbose : bool
+            If True, the ipopt iteration log is printed instead of being suppressed
 
         Returns
         -------
@@ -286,11 +364,32 @@ class InverseKinematics:
         """
 
         options = self._get_solver_options(method, options)
+        if verbose and method == "ipopt":
+            options = {**options, "ipopt.print_level": 5}
+        if jit:
+            options = {
+                **options,
+                "jit": True,
+                "compiler": "shell",
+                "jit_options": {"flags": ["-O2"], "temp_suffix": False},
+            }
         Q_init = self._get_initial_guess(Q_init, initial_guess_mode)
 
-        Qopt = self._solve_frame_per_frame(Q_init, initial_guess_mode, method, options)
+        if nb_processes > 1:
+            if initial_guess_mode in (
+                InitialGuessModeType.USER_PROVIDED_FIRST_FRAME_ONLY,
+                InitialGuessModeType.FROM_FIRST_FRAME_MARKERS,
+            ):
+                raise ValueError(
+                    f"nb_processes > 1 is not available with {initial_guess_mode} "
+                    "because each frame is warm-started with the solution of the previous one."
+                )
+            Qopt = self._solve_frames_in_parallel(Q_init, method, options, nb_processes)
+        else:
+            Qopt = self._solve_frame_per_frame(Q_init, initial_guess_mode, method, options)
 
-        self.Qopt = Qopt.reshape((12 * self.model.nb_segments, self.nb_frames))
+        # both solve paths already return the [12 * nb_segments x nb_frames] layout
+        self.Qopt = Qopt
         self.check_segment_determinants()
         return Qopt
 
@@ -299,7 +398,11 @@ class InverseKinematics:
         if options is None:
             if method not in default_options:
                 raise ValueError("method must be one of the following str: 'sqpmethod' or 'ipopt'")
-            return default_options[method]
+            options = default_options[method]
+            if method == "ipopt":
+                # the parallel HSL solvers factorize the KKT system faster than the default mumps,
+                # so the best one available is probed once and used by default
+                options = {**options, "ipopt.linear_solver": best_ipopt_linear_solver()}
         return options
 
     def _get_initial_guess(
@@ -351,37 +454,188 @@ class InverseKinematics:
         method: str,
         options: dict,
     ) -> np.ndarray:
-        Qopt = np.zeros((12 * self.model.nb_segments, self.nb_frames))
-        nlp = self._setup_nlp()
+        # column-major so each per-frame write lands in one contiguous block of memory
+        Qopt = np.empty((12 * self.model.nb_segments, self.nb_frames), order="F")
+        # when the initial guess chains one frame to the next, the multipliers of the previous
+        # frame are fed back as well so ipopt can warm start instead of recomputing them
+        warm_start = initial_guess_mode in (
+            InitialGuessModeType.USER_PROVIDED_FIRST_FRAME_ONLY,
+            InitialGuessModeType.FROM_FIRST_FRAME_MARKERS,
+        )
+        if warm_start and method == "ipopt":
+            options = {
+                **options,
+                "ipopt.warm_start_init_point": "yes",
+                "ipopt.warm_start_bound_push": 1e-9,
+                "ipopt.warm_start_mult_bound_push": 1e-9,
+            }
+        # the experimental data enters the problem as a parameter, so one solver is constructed for the
+        # whole trial and only the parameter value changes from frame to frame, instead of rebuilding
+        # the solver (sparsity analysis, derivative graphs, initialization) on every frame
+        solver = self._get_solver(method, options)
+        lbg, ubg = self._get_constraint_bounds()
         self.objective_function = np.zeros(self.nb_frames)
 
+        lam_x0 = lam_g0 = None
         for f in range(self.nb_frames):
-            nlp["f"] = self._get_objective_for_frame(f)
-            r, success = self._solve_single_frame(method, nlp, Q_init[:, f], options)
-            Qopt[:, f : f + 1] = r["x"].toarray()
+            r, success = self._solve_single_frame(
+                solver, Q_init[:, f], self._get_parameters_for_frame(f), lbg, ubg, lam_x0, lam_g0
+            )
+            Qopt[:, f] = np.asarray(r["x"]).reshape(-1)
             self.objective_function[f] = r["f"]
             Q_init = self._update_initial_guess(Q_init, Qopt, initial_guess_mode, f)
+            if warm_start:
+                lam_x0, lam_g0 = r["lam_x"], r["lam_g"]
 
         return Qopt
 
+    def _solve_frames_in_parallel(
+        self,
+        Q_init: np.ndarray | NaturalCoordinates,
+        method: str,
+        options: dict,
+        nb_processes: int,
+    ) -> np.ndarray:
+        """
+        Solves the frames distributed over worker processes; the frames are independent NLPs when the
+        initial guess does not chain them, so contiguous chunks are solved concurrently, each worker
+        building its own solver from the symbolic nlp.
+        """
+        # only the symbolic ingredients travel to the workers: a constructed (let alone already run)
+        # ipopt solver carries process state that deadlocks forked workers and cannot be unpickled in
+        # spawned ones. The spawn context keeps the workers clear of that state as well.
+        nlp = self._setup_nlp()
+        serialized_nlp = Function("nlp", [nlp["x"], nlp["p"]], [nlp["f"], nlp["g"]], ["x", "p"], ["f", "g"]).serialize()
+        lbg, ubg = self._get_constraint_bounds()
+        parameters = [self._get_parameters_for_frame(f) for f in range(self.nb_frames)]
+
+        chunks = [idx for idx in np.array_split(np.arange(self.nb_frames), nb_processes) if idx.size]
+        with ProcessPoolExecutor(
+            max_workers=nb_processes,
+            mp_context=get_context("spawn"),
+            initializer=_limit_worker_threads,
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _solve_frame_chunk,
+                    serialized_nlp,
+                    method,
+                    options,
+                    Q_init[:, idx],
+                    [parameters[i] for i in idx],
+                    lbg,
+                    ubg,
+                )
+                for idx in chunks
+            ]
+            results = [future.result() for future in futures]
+
+        Qopt = np.concatenate([Qopt_chunk for Qopt_chunk, _, _ in results], axis=1)
+        self.objective_function = np.concatenate([objectives for _, objectives, _ in results])
+        for _, _, successes in results:
+            self.success_optim.extend(successes)
+        for _ in range(sum(not success for success in self.success_optim)):
+            print("Inverse Kinematics failed to converge")
+
+        return Qopt
+
+    def precompile(self, method: str = "ipopt", options: dict = None) -> str:
+        """
+        Generates C code for the NLP callbacks, compiles it into a shared library and reloads the solver
+        from it, so the callbacks run as native code. The library is cached in ~/.cache/bionc keyed by a
+        hash of the generated code: later sessions with the same problem structure skip the compilation
+        and only pay the load. The compiled solver replaces the cached one, so a subsequent solve() with
+        the same method and options uses it directly.
+
+        Parameters
+        ----------
+        method : str
+            The method to use to solve the NLP (ipopt, sqpmethod, ...)
+        options : dict
+            The options to pass to the solver
+
+        Returns
+        -------
+        str
+            The path of the compiled shared library
+        """
+        options = self._get_solver_options(method, options)
+        solver = self._get_solver(method, options)
+
+        cache_dir = Path.home() / ".cache" / "bionc"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            previous_dir = os.getcwd()
+            os.chdir(tmp)  # generate_dependencies writes in the current directory
+            try:
+                solver.generate_dependencies("ik_nlp.c")
+            finally:
+                os.chdir(previous_dir)
+            source = Path(tmp, "ik_nlp.c")
+            digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+            library = cache_dir / f"ik_nlp_{digest}.so"
+            if not library.exists():
+                subprocess.run(
+                    ["gcc", "-O3", "-march=native", "-fPIC", "-shared", str(source), "-o", str(library)],
+                    check=True,
+                )
+
+        self._solver_cache = ((method, repr(options)), nlpsol("InverseKinematics", method, str(library), options))
+        return str(library)
+
+    def _get_solver(self, method: str, options: dict) -> Function:
+        """
+        This function returns the nlp solver, cached across solve() calls so that the symbolic expansion
+        and the solver construction only run again when the method, the options or the objective change.
+        """
+        key = (method, repr(options))
+        cached = getattr(self, "_solver_cache", None)
+        if cached is None or cached[0] != key:
+            self._solver_cache = (key, nlpsol("InverseKinematics", method, self._setup_nlp(), options))
+        return self._solver_cache[1]
+
     def _setup_nlp(self) -> dict:
+        if getattr(self, "_nlp_cache", None) is not None:
+            return self._nlp_cache
+
         constraints = self._constraints(self._Q_sym)
         if self._active_direct_frame_constraints:
             constraints = vertcat(constraints, self._direct_frame_constraints(self._Q_sym))
 
-        nlp = {
+        objective = self._objective_function(
+            self._Q_sym,
+            self._markers_sym,
+            self._camera_parameters_sym,
+            self._gaussian_parameters_sym,
+        )
+        parameters = vertcat(
+            vec(self._markers_sym),
+            vec(self._camera_parameters_sym),
+            vec(self._gaussian_parameters_sym),
+        )
+        data_symbolics = [
+            self._vert_Q_sym,
+            self._markers_sym,
+            self._camera_parameters_sym,
+            self._gaussian_parameters_sym,
+        ]
+
+        # common-subexpression elimination shrinks the expression graphs before the solver
+        # differentiates them: the segments share interpolation and frame subexpressions, so
+        # every objective, gradient and jacobian evaluation traverses a smaller graph
+        self._nlp_cache = {
             "x": self._vert_Q_sym,
-            "g": _mx_to_sx(constraints, [self._vert_Q_sym]) if self.use_sx else constraints,
+            "p": parameters,
+            "f": cse(_mx_to_sx(objective, data_symbolics) if self.use_sx else objective),
+            "g": cse(_mx_to_sx(constraints, [self._vert_Q_sym]) if self.use_sx else constraints),
         }
-        return nlp
+        return self._nlp_cache
 
-    def _get_objective_for_frame(self, frame: int) -> MX:
-        return self._objective_function(
-            self._Q_sym,
-            [] if self.experimental_markers is None else self.experimental_markers[:, :, frame],
-            [] if self.experimental_heatmaps is None else self.camera_parameters,
-            [] if self.experimental_heatmaps is None else self.gaussian_parameters[:, frame, :],
-        )
+    def _get_parameters_for_frame(self, frame: int) -> np.ndarray:
+        """Stacks the experimental data of the frame in the column-major order of the parameter vector"""
+        if self.experimental_markers is not None:
+            return self._markers_flat[:, frame]
+        return np.concatenate((self._camera_parameters_flat, self._gaussian_parameters_flat[:, frame]))
 
     def _update_initial_guess(
         self,
@@ -402,9 +656,24 @@ class InverseKinematics:
             Q_init = np.append(Q_init, Qopt[:, frame : frame + 1], axis=1)
         return Q_init
 
-    def _solve_single_frame(self, method: str, nlp: dict, Q_init_frame: np.ndarray, options: dict) -> tuple:
-        lbg, ubg = self._get_constraint_bounds()
-        r, success = _solve_nlp(method, nlp, Q_init_frame, lbg, ubg, options)
+    def _solve_single_frame(
+        self,
+        solver: Function,
+        Q_init_frame: np.ndarray,
+        parameters: np.ndarray,
+        lbg: np.ndarray,
+        ubg: np.ndarray,
+        lam_x0: np.ndarray = None,
+        lam_g0: np.ndarray = None,
+    ) -> tuple:
+        kwargs = dict(x0=Q_init_frame, p=parameters, lbg=lbg, ubg=ubg)
+        if lam_x0 is not None:
+            kwargs["lam_x0"] = lam_x0
+            kwargs["lam_g0"] = lam_g0
+        r = solver(**kwargs)
+        success = solver.stats()["success"]
+        if success is False:
+            print("Inverse Kinematics failed to converge")
         self.success_optim.append(success)
         return r, success
 
@@ -417,16 +686,13 @@ class InverseKinematics:
         return lbg, ubg
 
     def _declare_sym_Q(self) -> tuple[MX, MX]:
-        """Declares the symbolic variables for the natural coordinates and handle single frame"""
-        Q_sym = []
-        f = 0
-        Q_f_sym = []
-        for ii in range(self.model.nb_segments):
-            Q_f_sym.append(SegmentNaturalCoordinates.sym(f"_{ii}_{f}"))
-        Q_sym.append(vertcat(*Q_f_sym))
-        Q = horzcat(*Q_sym)
-        vert_Q = vertcat(*Q_sym)
-        return Q, vert_Q
+        """Declares the symbolic variables for the natural coordinates of the single frame being solved"""
+        # one matrix symbol instead of per-segment symbols chained with vertcat, which grows the
+        # graph once per segment; the segment blocks are sliced out of it on demand.
+        # the NaturalCoordinates wrapper is built here once so the objective and constraint
+        # builders do not re-run its shape checks and index computations
+        Q = NaturalCoordinates(MX.sym("Q", 12 * self.model.nb_segments))
+        return Q, Q
 
     def _objective_minimize_marker_distance(self, Q, experimental_markers) -> MX:
         """
@@ -437,10 +703,9 @@ class InverseKinematics:
         MX
             The objective function that minimizes the distance between the experimental markers and the model markers
         """
-        f = 0
-        Q_f = NaturalCoordinates(Q[:, f])
+        Q_f = Q
         xp_markers = (
-            experimental_markers[:3, :, f] if isinstance(experimental_markers, np.ndarray) else experimental_markers
+            experimental_markers[:3, :, 0] if isinstance(experimental_markers, np.ndarray) else experimental_markers
         )
         phim = self._model_mx.markers_constraints(xp_markers, Q_f, only_technical=True)
 
@@ -456,7 +721,7 @@ class InverseKinematics:
         MX
             The objective function that maximizes the confidence value of the model keypoints
         """
-        Q_f = NaturalCoordinates(Q)
+        Q_f = Q
         all_marker_position = self._model_mx.markers(Q_f)
         marker_positions = subset_of_technical_markers(self._model_mx, all_marker_position)
         total_confidence = compute_total_confidence(marker_positions, camera_parameters, gaussian_parameters)
@@ -464,36 +729,40 @@ class InverseKinematics:
         return 1 / total_confidence
 
     def _constraints(self, Q) -> MX:
-        """Computes the constraints and handle single frame or multi frames"""
-        phir = []
-        phik = []
-        f = 0
-        Q_f = NaturalCoordinates(Q[:, f])
-        phir.append(self._model_mx.rigid_body_constraints(Q_f))
-        phik.append(self._model_mx.joint_constraints(Q_f))
-        return vertcat(*phir, *phik)
+        """Computes the constraints of the single frame being solved"""
+        return vertcat(self._model_mx.rigid_body_constraints(Q), self._model_mx.joint_constraints(Q))
 
     def _direct_frame_constraints(self, Q):
-        """Computes the direct frame constraints and handle single frame or multi frames"""
-        direct_frame_constraints = []
-        f = 0
-        Q_f = NaturalCoordinates(Q[:, f])
-        for ii in range(self.model.nb_segments):
-            u, v, w = Q_f.vector(ii).to_uvw()
-            direct_frame_constraints.append(sarrus(horzcat(u, v, w)))
-        return vertcat(*direct_frame_constraints)
+        """Computes the direct frame constraints of the single frame being solved"""
+        # the segment frames are stacked side by side and all determinants come out of one
+        # element-wise triple product u . (v x w), instead of one small sarrus graph per segment
+        uvw = [Q.vector(ii).to_uvw() for ii in range(self.model.nb_segments)]
+        U = horzcat(*[u for u, _, _ in uvw])
+        V = horzcat(*[v for _, v, _ in uvw])
+        W = horzcat(*[w for _, _, w in uvw])
+        determinants = (
+            U[0, :] * (V[1, :] * W[2, :] - V[2, :] * W[1, :])
+            - U[1, :] * (V[0, :] * W[2, :] - V[2, :] * W[0, :])
+            + U[2, :] * (V[0, :] * W[1, :] - V[1, :] * W[0, :])
+        )
+        return determinants.T
 
     def check_segment_determinants(self):
         """Checks the determinant of each segment frame with the optimal solution"""
-        self.segment_determinants = np.zeros((self.model.nb_segments, self.nb_frames))
-        for i in range(0, self.Qopt.shape[1]):
-            Qi = NaturalCoordinatesNumpy(self.Qopt)[:, i : i + 1]
-            for s in range(0, self.model.nb_segments):
-                u, v, w = Qi.vector(s).to_uvw()
-                matrix = np.concatenate((u[:, np.newaxis], v[:, np.newaxis], w[:, np.newaxis]), axis=1)
-                self.segment_determinants[s, i] = np.linalg.det(matrix)
-                if self.segment_determinants[s, i] < 0:
-                    print(f"Warning: frame {i} segment {s} has a negative determinant")
+        # each segment occupies a contiguous block of 12 rows, so the whole trial reshapes to
+        # (nb_segments, 12, nb_frames) and every determinant comes out of one vectorized
+        # scalar triple product u . (v x w) instead of per-frame np.linalg.det calls
+        Q = self.Qopt.reshape((self.model.nb_segments, 12, self.nb_frames))
+        u = Q[:, 0:3, :]
+        v = Q[:, 3:6, :] - Q[:, 6:9, :]  # v = rp - rd
+        w = Q[:, 9:12, :]
+        self.segment_determinants = (
+            u[:, 0] * (v[:, 1] * w[:, 2] - v[:, 2] * w[:, 1])
+            - u[:, 1] * (v[:, 0] * w[:, 2] - v[:, 2] * w[:, 0])
+            + u[:, 2] * (v[:, 0] * w[:, 1] - v[:, 1] * w[:, 0])
+        )
+        for s, i in np.argwhere(self.segment_determinants < 0):
+            print(f"Warning: frame {i} segment {s} has a negative determinant")
 
     def sol(self):
         """
@@ -533,9 +802,10 @@ class InverseKinematics:
         )
         segment_rigidity_residual_norm = np.sqrt(np.sum(segment_rigidity_residuals**2, axis=0))
 
-        # Global will correspond to the squared sum of all the specific residuals
-        total_joint_residuals = TimeSeriesUtils.total_joint_constraints(self.model, self.Qopt)
-        total_rigidity_residuals = TimeSeriesUtils.total_rigid_body_constraints(self.model, self.Qopt)
+        # Global will correspond to the squared sum of all the specific residuals,
+        # reduced from the residual matrices instead of re-evaluating the constraints frame by frame
+        total_joint_residuals = np.linalg.norm(joint_residuals, axis=0)
+        total_rigidity_residuals = np.linalg.norm(rigidity_residuals, axis=0)
 
         ind_max_rigidy_error = np.argmax(segment_rigidity_residual_norm, axis=0)
         ind_max_joint_constraint_error = np.argmax(joint_residuals, axis=0)
@@ -569,9 +839,9 @@ class InverseKinematics:
             )
             marker_residuals_norm = np.sqrt(np.sum(marker_residuals_xyz**2, axis=0))
 
-            total_marker_residuals = TimeSeriesUtils.total_marker_constraints(
-                self.model, self.Qopt, self.experimental_markers
-            )
+            # the xyz residuals are a reshape of the marker constraint vector, so the global residual
+            # reduces from them directly instead of re-evaluating the constraints frame by frame
+            total_marker_residuals = np.sqrt(np.sum(marker_residuals_xyz**2, axis=(0, 1)))
             ind_max_marker_distance = np.argmax(marker_residuals_norm, axis=0)
             max_marker_distance = [self.model.marker_names_technical[ind_max] for ind_max in ind_max_marker_distance]
 
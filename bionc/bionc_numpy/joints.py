@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 
 from .natural_coordinates import SegmentNaturalCoordinates
@@ -9,6 +11,29 @@ from ..protocols.joint import JointBaseWithTwoSegments as JointBase
 from ..utils.enums import NaturalAxis, CartesianAxis, EulerSequence, TransformationMatrixType
 
 
+def _axis_from_flat(Q: np.ndarray, axis: NaturalAxis) -> np.ndarray:
+    """
+    This function returns the axis components from a raveled natural coordinates vector,
+    skipping the enum dispatch and the array copies made by SegmentNaturalCoordinates.axis.
+    """
+    if axis is NaturalAxis.U:
+        return Q[0:3]
+    if axis is NaturalAxis.W:
+        return Q[9:12]
+    return Q[3:6] - Q[6:9]
+
+
+@lru_cache(maxsize=None)
+def _casadi_joint():
+    """
+    This function returns the casadi Joint interface; imported lazily to prevent circular imports
+    and cached so to_mx calls skip the sys.modules lookup.
+    """
+    from ..bionc_casadi.joints import Joint as CasadiJoint
+
+    return CasadiJoint
+
+
 class Joint:
     """
     The public interface to the different Joint classes
@@ -104,9 +129,7 @@ class Joint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.Free(
+            return _casadi_joint().Free(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
@@ -138,20 +161,26 @@ class Joint:
                 name, parent, child, index, projection_basis, parent_basis, child_basis, None
             )
 
-            # check size and type of parent axis
+            # check size and type of parent axis, in one pass: the identity check on the class
+            # is enough because NaturalAxis is an enum and cannot be subclassed
             if not isinstance(parent_axis, (tuple, list)) or len(parent_axis) != 2:
                 raise TypeError("parent_axis should be a tuple or list with 2 NaturalAxis")
-            if not all(isinstance(axis, NaturalAxis) for axis in parent_axis):
+            if parent_axis[0].__class__ is not NaturalAxis or parent_axis[1].__class__ is not NaturalAxis:
                 raise TypeError("parent_axis should be a tuple or list with 2 NaturalAxis")
 
             # check size and type of child axis
             if not isinstance(child_axis, (tuple, list)) or len(child_axis) != 2:
                 raise TypeError("child_axis should be a tuple or list with 2 NaturalAxis")
-            if not all(isinstance(axis, NaturalAxis) for axis in child_axis):
+            if child_axis[0].__class__ is not NaturalAxis or child_axis[1].__class__ is not NaturalAxis:
                 raise TypeError("child_axis should be a tuple or list with 2 NaturalAxis")
 
-            # check size and type of theta
-            if not isinstance(theta, (tuple, list, np.ndarray)) or len(theta) != 2:
+            # check size and type of theta; casting once also rejects multi-dimensional arrays,
+            # which a bare len() check would let through
+            try:
+                theta = np.ascontiguousarray(theta, dtype=np.float64)
+            except (TypeError, ValueError):
+                raise TypeError("theta should be a tuple or list with 2 float")
+            if theta.shape != (2,):
                 raise TypeError("theta should be a tuple or list with 2 float")
 
             # todo: there should be a check on the euler sequence and transformation matrix type here
@@ -169,6 +198,31 @@ class Joint:
 
             self.nb_constraints = 5
 
+        def _axis_constants(self) -> dict:
+            """
+            This function returns the cached constant matrices of the joint axes: the fused product
+            parent_rot.T @ child_rot of the interpolation rotations and the cosine of the angles.
+            They only depend on the axes and angles fixed at construction, so they are built once
+            instead of being recomputed on every constraint evaluation.
+            """
+            if getattr(self, "_axis_constants_cache", None) is None:
+                parent_rot = [np.asarray(vector.interpolate().rot) for vector in self.parent_vector]
+                child_rot = [np.asarray(vector.interpolate().rot) for vector in self.child_vector]
+                K_parent_template = np.zeros((self.nb_constraints, 12))
+                K_parent_template[:3, 6:9] = np.eye(3)
+                K_child_template = np.zeros((self.nb_constraints, 12))
+                K_child_template[:3, 3:6] = -np.eye(3)
+                # stacking the two axis products lets the jacobians run as one batched matmul
+                rot_products = np.stack([p.T @ c for p, c in zip(parent_rot, child_rot)])
+                self._axis_constants_cache = dict(
+                    parent_rot_T_child_rot=np.ascontiguousarray(rot_products),
+                    child_rot_T_parent_rot=np.ascontiguousarray(rot_products.transpose(0, 2, 1)),
+                    cos_theta=np.cos(np.asarray(self.theta, dtype=np.float64)),
+                    K_parent_template=K_parent_template,
+                    K_child_template=K_child_template,
+                )
+            return self._axis_constants_cache
+
         def constraint(self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates) -> np.ndarray:
             """
             This function returns the kinematic constraints of the joint, denoted Phi_k
@@ -179,62 +233,57 @@ class Joint:
             np.ndarray
                 Kinematic constraints of the joint [5, 1]
             """
+            cos_theta = self._axis_constants()["cos_theta"]
+            Qp = np.asarray(Q_parent).ravel()
+            Qc = np.asarray(Q_child).ravel()
             constraint = np.zeros(self.nb_constraints)
-            constraint[:3] = Q_parent.rd - Q_child.rp
+            constraint[:3] = Qp[6:9] - Qc[3:6]  # rd - rp, sliced from the flat vectors
+
+            # unrolled over the two axes, with inlined scalar products: np.dot dispatch
+            # costs more than the three multiplies
+            pa = _axis_from_flat(Qp, self.parent_axis[0])
+            ca = _axis_from_flat(Qc, self.child_axis[0])
+            constraint[3] = pa[0] * ca[0] + pa[1] * ca[1] + pa[2] * ca[2] - cos_theta[0]
 
-            for i in range(2):
-                constraint[i + 3] = np.dot(
-                    Q_parent.axis(self.parent_axis[i]), Q_child.axis(self.child_axis[i])
-                ) - np.cos(self.theta[i])
+            pa = _axis_from_flat(Qp, self.parent_axis[1])
+            ca = _axis_from_flat(Qc, self.child_axis[1])
+            constraint[4] = pa[0] * ca[0] + pa[1] * ca[1] + pa[2] * ca[2] - cos_theta[1]
 
             return constraint
 
         def parent_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_parent = np.zeros((self.nb_constraints, 12))
-            K_k_parent[:3, 6:9] = np.eye(3)
-
-            for i in range(2):
-                K_k_parent[i + 3, :] = np.squeeze(
-                    self.parent_vector[i].interpolate().rot.T
-                    @ np.array(self.child_vector[i].interpolate().rot @ Q_child)
-                )
+            constants = self._axis_constants()
+            K_k_parent = constants["K_parent_template"].copy()
+            K_k_parent[3:5, :] = constants["parent_rot_T_child_rot"] @ np.asarray(Q_child).ravel()
 
             return K_k_parent
 
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-            K_k_child[:3, 3:6] = -np.eye(3)
-
-            for i in range(2):
-                K_k_child[i + 3, :] = np.squeeze(
-                    (self.parent_vector[i].interpolate().rot @ Q_parent).T @ self.child_vector[i].interpolate().rot
-                )
+            constants = self._axis_constants()
+            K_k_child = constants["K_child_template"].copy()
+            K_k_child[3:5, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Q_parent).ravel()
 
             return K_k_child
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
+            constants = self._axis_constants()
             K_k_parent_dot = np.zeros((self.nb_constraints, 12))
-            for i in range(2):
-                K_k_parent_dot[i + 3, :] = np.squeeze(
-                    self.parent_vector[i].interpolate().rot.T @ self.child_vector[i].interpolate().rot @ Qdot_child
-                )
+            K_k_parent_dot[3:5, :] = constants["parent_rot_T_child_rot"] @ np.asarray(Qdot_child).ravel()
 
             return K_k_parent_dot
 
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
+            constants = self._axis_constants()
             K_k_child_dot = np.zeros((self.nb_constraints, 12))
-            for i in range(2):
-                K_k_child_dot[i + 3, :] = np.squeeze(
-                    (self.parent_vector[i].interpolate().rot @ Qdot_parent).T @ self.child_vector[i].interpolate().rot
-                )
+            K_k_child_dot[3:5, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Qdot_parent).ravel()
 
             return K_k_child_dot
 
@@ -250,8 +299,15 @@ class Joint:
             tuple[np.ndarray, np.ndarray]
                 joint constraints jacobian of the parent and child segment [5, 12] and [5, 12]
             """
+            # both jacobians are filled in one pass so the cached products are fetched once
+            constants = self._axis_constants()
+            K_k_parent = constants["K_parent_template"].copy()
+            K_k_child = constants["K_child_template"].copy()
 
-            return self.parent_constraint_jacobian(Q_parent, Q_child), self.child_constraint_jacobian(Q_parent, Q_child)
+            K_k_parent[3:5, :] = constants["parent_rot_T_child_rot"] @ np.asarray(Q_child).ravel()
+            K_k_child[3:5, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Q_parent).ravel()
+
+            return K_k_parent, K_k_child
 
         def constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -265,9 +321,13 @@ class Joint:
             tuple[np.ndarray, np.ndarray]
                 joint constraints jacobian derivative of the parent and child segment [5, 12] and [5, 12]
             """
-            return self.parent_constraint_jacobian_derivative(
-                Qdot_parent, Qdot_child
-            ), self.child_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
+            constants = self._axis_constants()
+            # one (nb_constraints, 24) allocation holds both blocks, returned as views
+            K_k_dot = np.zeros((self.nb_constraints, 24))
+            K_k_dot[3:5, :12] = constants["parent_rot_T_child_rot"] @ np.asarray(Qdot_child).ravel()
+            K_k_dot[3:5, 12:] = constants["child_rot_T_parent_rot"] @ np.asarray(Qdot_parent).ravel()
+
+            return K_k_dot[:, :12], K_k_dot[:, 12:]
 
         def to_mx(self):
             """
@@ -278,9 +338,7 @@ class Joint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.Hinge(
+            return _casadi_joint().Hinge(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
@@ -354,6 +412,32 @@ class Joint:
 
             self.nb_constraints = 4
 
+        def _axis_constants(self) -> dict:
+            """
+            This function returns the cached constant matrices of the joint axes: the fused product
+            parent_rot.T @ child_rot of the interpolation rotations and the cosine of theta.
+            They only depend on the axis and angle fixed at construction, so they are built once
+            instead of being recomputed on every constraint evaluation.
+            """
+            if getattr(self, "_axis_constants_cache", None) is None:
+                parent_rot = np.asarray(self.parent_vector.interpolate().rot)
+                child_rot = np.asarray(self.child_vector.interpolate().rot)
+                K_parent_template = np.zeros((self.nb_constraints, 12))
+                K_parent_template[:3, 6:9] = np.eye(3)
+                K_child_template = np.zeros((self.nb_constraints, 12))
+                K_child_template[:3, 3:6] = -np.eye(3)
+                # both orientations of the product are kept contiguous so BLAS always
+                # sees the fast matrix @ vector layout
+                rot_product = np.ascontiguousarray(parent_rot.T @ child_rot)
+                self._axis_constants_cache = dict(
+                    parent_rot_T_child_rot=rot_product,
+                    child_rot_T_parent_rot=np.ascontiguousarray(rot_product.T),
+                    cos_theta=float(np.cos(self.theta)),
+                    K_parent_template=K_parent_template,
+                    K_child_template=K_child_template,
+                )
+            return self._axis_constants_cache
+
         def constraint(self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates) -> np.ndarray:
             """
             This function returns the kinematic constraints of the joint, denoted Phi_k
@@ -364,53 +448,51 @@ class Joint:
             np.ndarray
                 Kinematic constraints of the joint [4, 1]
             """
+            cos_theta = self._axis_constants()["cos_theta"]
+            Qp = np.asarray(Q_parent).ravel()
+            Qc = np.asarray(Q_child).ravel()
             constraint = np.zeros(self.nb_constraints)
-            constraint[:3] = Q_parent.rd - Q_child.rp
-            constraint[3] = np.dot(Q_parent.axis(self.parent_axis), Q_child.axis(self.child_axis)) - np.cos(self.theta)
+            constraint[:3] = Qp[6:9] - Qc[3:6]  # rd - rp, sliced from the flat vectors
+            # inlined scalar product, np.dot dispatch costs more than the three multiplies
+            pa = _axis_from_flat(Qp, self.parent_axis)
+            ca = _axis_from_flat(Qc, self.child_axis)
+            constraint[3] = pa[0] * ca[0] + pa[1] * ca[1] + pa[2] * ca[2] - cos_theta
 
             return constraint
 
         def parent_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_parent = np.zeros((self.nb_constraints, 12))
-            K_k_parent[:3, 6:9] = np.eye(3)
-
-            K_k_parent[3, :] = np.squeeze(
-                self.parent_vector.interpolate().rot.T @ np.array(self.child_vector.interpolate().rot @ Q_child)
-            )
+            constants = self._axis_constants()
+            K_k_parent = constants["K_parent_template"].copy()
+            K_k_parent[3, :] = constants["parent_rot_T_child_rot"] @ np.asarray(Q_child).ravel()
 
             return K_k_parent
 
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-            K_k_child[:3, 3:6] = -np.eye(3)
-
-            K_k_child[3, :] = np.squeeze(
-                (self.parent_vector.interpolate().rot @ Q_parent).T @ self.child_vector.interpolate().rot
-            )
+            constants = self._axis_constants()
+            K_k_child = constants["K_child_template"].copy()
+            K_k_child[3, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Q_parent).ravel()
 
             return K_k_child
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
+            rot_product = self._axis_constants()["parent_rot_T_child_rot"]
             K_k_parent_dot = np.zeros((self.nb_constraints, 12))
-            K_k_parent_dot[3, :] = np.squeeze(
-                self.parent_vector.interpolate().rot.T @ np.array(self.child_vector.interpolate().rot @ Qdot_child)
-            )
+            K_k_parent_dot[3, :] = rot_product @ np.asarray(Qdot_child).ravel()
 
             return K_k_parent_dot
 
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
+            constants = self._axis_constants()
             K_k_child_dot = np.zeros((self.nb_constraints, 12))
-            K_k_child_dot[3, :] = np.squeeze(
-                (self.parent_vector.interpolate().rot @ Qdot_parent).T @ self.child_vector.interpolate().rot
-            )
+            K_k_child_dot[3, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Qdot_parent).ravel()
 
             return K_k_child_dot
 
@@ -426,8 +508,16 @@ class Joint:
             tuple[np.ndarray, np.ndarray]
                 joint constraints jacobian of the parent and child segment [4, 12] and [4, 12]
             """
+            # both jacobians are filled in one pass so the cached product is fetched once
+            constants = self._axis_constants()
+            rot_product = constants["parent_rot_T_child_rot"]
+            K_k_parent = constants["K_parent_template"].copy()
+            K_k_parent[3, :] = rot_product @ np.asarray(Q_child).ravel()
 
-            return self.parent_constraint_jacobian(Q_parent, Q_child), self.child_constraint_jacobian(Q_parent, Q_child)
+            K_k_child = constants["K_child_template"].copy()
+            K_k_child[3, :] = constants["child_rot_T_parent_rot"] @ np.asarray(Q_parent).ravel()
+
+            return K_k_parent, K_k_child
 
         def constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -441,10 +531,13 @@ class Joint:
             tuple[np.ndarray, np.ndarray]
                 joint constraints jacobian of the parent and child segment [4, 12] and [4, 12]
             """
+            constants = self._axis_constants()
+            # one (nb_constraints, 24) allocation holds both blocks, returned as views
+            K_k_dot = np.zeros((self.nb_constraints, 24))
+            K_k_dot[3, :12] = constants["parent_rot_T_child_rot"] @ np.asarray(Qdot_child).ravel()
+            K_k_dot[3, 12:] = constants["child_rot_T_parent_rot"] @ np.asarray(Qdot_parent).ravel()
 
-            return self.parent_constraint_jacobian_derivative(
-                Qdot_parent, Qdot_child
-            ), self.child_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
+            return K_k_dot[:, :12], K_k_dot[:, 12:]
 
         def to_mx(self):
             """
@@ -455,9 +548,7 @@ class Joint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.Universal(
+            return _casadi_joint().Universal(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
@@ -531,35 +622,44 @@ class Joint:
 
             return constraint.squeeze()
 
+        def _jacobian_constants(self) -> dict:
+            """
+            This function returns the cached jacobians of the joint; they do not depend on the
+            coordinates for a spherical joint, so they are built once and copied on each call.
+            """
+            if getattr(self, "_jacobian_constants_cache", None) is None:
+                K_k_parent = np.zeros((self.nb_constraints, 12))
+                K_k_parent[:3, :] = self.parent_point.interpolation_matrix
+                K_k_child = np.zeros((self.nb_constraints, 12))
+                K_k_child[:3, :] = -self.child_point.interpolation_matrix
+                K_k_dot = np.zeros((self.nb_constraints, 12))
+                K_k_dot.flags.writeable = False  # shared across calls, so it must not be mutated
+                self._jacobian_constants_cache = dict(
+                    K_k_parent=K_k_parent,
+                    K_k_child=K_k_child,
+                    K_k_dot=K_k_dot,
+                )
+            return self._jacobian_constants_cache
+
         def parent_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_parent = np.zeros((self.nb_constraints, 12))
-            K_k_parent[:3, :] = self.parent_point.interpolation_matrix
-
-            return K_k_parent
+            return self._jacobian_constants()["K_k_parent"].copy()
 
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-            K_k_child[:3, :] = -self.child_point.interpolation_matrix
-
-            return K_k_child
+            return self._jacobian_constants()["K_k_child"].copy()
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_parent_dot = np.zeros((self.nb_constraints, 12))
-
-            return K_k_parent_dot
+            return self._jacobian_constants()["K_k_dot"]
 
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_child_dot = np.zeros((self.nb_constraints, 12))
-
-            return K_k_child_dot
+            return self._jacobian_constants()["K_k_dot"]
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -600,9 +700,7 @@ class Joint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.Spherical(
+            return _casadi_joint().Spherical(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
@@ -765,9 +863,7 @@ class Joint:
                 The joint as a mx joint
             """
 
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.SphereOnPlane(
+            return _casadi_joint().SphereOnPlane(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
@@ -839,9 +935,22 @@ class Joint:
             parent_point_location = self.parent_point.position_in_global(Q_parent)
             child_point_location = self.child_point.position_in_global(Q_child)
 
-            constraint = np.sum((parent_point_location - child_point_location) ** 2) - self.length**2
+            # inlined scalar product, np.sum reduction machinery costs more than the three multiplies
+            d = np.asarray(parent_point_location - child_point_location).ravel()
 
-            return constraint
+            return d[0] * d[0] + d[1] * d[1] + d[2] * d[2] - self.length**2
+
+        def _interpolation_constants(self) -> dict:
+            """
+            This function returns the cached interpolation matrices of the joint points, pre-scaled by the
+            jacobian factors of the squared-distance constraint, so each jacobian call reduces to one matmul.
+            """
+            if getattr(self, "_interpolation_constants_cache", None) is None:
+                self._interpolation_constants_cache = dict(
+                    two_parent_interp=2 * np.asarray(self.parent_point.interpolation_matrix),
+                    minus_two_child_interp=-2 * np.asarray(self.child_point.interpolation_matrix),
+                )
+            return self._interpolation_constants_cache
 
         def parent_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -849,9 +958,9 @@ class Joint:
             parent_point_location = self.parent_point.position_in_global(Q_parent)
             child_point_location = self.child_point.position_in_global(Q_child)
 
-            K_k_parent = 2 * (parent_point_location - child_point_location).T @ self.parent_point.interpolation_matrix
+            d = parent_point_location - child_point_location
 
-            return np.array(K_k_parent)
+            return d.T @ self._interpolation_constants()["two_parent_interp"]
 
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -859,9 +968,9 @@ class Joint:
             parent_point_location = self.parent_point.position_in_global(Q_parent)
             child_point_location = self.child_point.position_in_global(Q_child)
 
-            K_k_child = -2 * (parent_point_location - child_point_location).T @ self.child_point.interpolation_matrix
+            d = parent_point_location - child_point_location
 
-            return np.array(K_k_child)
+            return d.T @ self._interpolation_constants()["minus_two_child_interp"]
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -869,11 +978,9 @@ class Joint:
             parent_point_location = self.parent_point.position_in_global(Qdot_parent)
             child_point_location = self.child_point.position_in_global(Qdot_child)
 
-            K_k_child_dot = (
-                2 * (parent_point_location - child_point_location).T @ self.parent_point.interpolation_matrix
-            )
+            d = parent_point_location - child_point_location
 
-            return np.array(K_k_child_dot)
+            return d.T @ self._interpolation_constants()["two_parent_interp"]
 
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -881,11 +988,9 @@ class Joint:
             parent_point_location = self.parent_point.position_in_global(Qdot_parent)
             child_point_location = self.child_point.position_in_global(Qdot_child)
 
-            K_k_parent_dot = (
-                -2 * (parent_point_location - child_point_location).T @ self.child_point.interpolation_matrix
-            )
+            d = parent_point_location - child_point_location
 
-            return np.array(K_k_parent_dot)
+            return d.T @ self._interpolation_constants()["minus_two_child_interp"]
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -900,10 +1005,11 @@ class Joint:
                 Kinematic constraints of the joint [1, 12] for parent and child
             """
 
-            K_k_parent = self.parent_constraint_jacobian(Q_parent, Q_child)
-            K_k_child = self.child_constraint_jacobian(Q_parent, Q_child)
+            # the point locations are computed once and shared by both jacobians
+            constants = self._interpolation_constants()
+            d_T = (self.parent_point.position_in_global(Q_parent) - self.child_point.position_in_global(Q_child)).T
 
-            return K_k_parent, K_k_child
+            return d_T @ constants["two_parent_interp"], d_T @ constants["minus_two_child_interp"]
 
         def constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -918,10 +1024,12 @@ class Joint:
                 Kinematic constraints of the joint [1, 12] for parent and child
             """
 
-            K_k_parent_dot = self.parent_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
-            K_k_child_dot = self.child_constraint_jacobian_derivative(Qdot_parent, Qdot_child)
+            constants = self._interpolation_constants()
+            d_T = (
+                self.parent_point.position_in_global(Qdot_parent) - self.child_point.position_in_global(Qdot_child)
+            ).T
 
-            return K_k_parent_dot, K_k_child_dot
+            return d_T @ constants["two_parent_interp"], d_T @ constants["minus_two_child_interp"]
 
         def to_mx(self):
             """
@@ -932,9 +1040,7 @@ class Joint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints import Joint as CasadiJoint
-
-            return CasadiJoint.ConstantLength(
+            return _casadi_joint().ConstantLength(
                 name=self.name,
                 parent=self.parent.to_mx(),
                 child=self.child.to_mx(),
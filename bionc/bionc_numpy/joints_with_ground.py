@@ -1,4 +1,8 @@
+import math
+from functools import lru_cache
+
 import numpy as np
+from numba import float64, int64, njit
 
 from .cartesian_vector import CartesianVector
 from .natural_coordinates import SegmentNaturalCoordinates
@@ -9,6 +13,72 @@ from ..protocols.joint import JointBase
 from ..utils.enums import NaturalAxis, CartesianAxis, EulerSequence, TransformationMatrixType
 
 
+@lru_cache(maxsize=None)
+def _casadi_ground_joint():
+    """
+    This function returns the casadi GroundJoint interface; imported lazily to prevent circular
+    imports and cached so to_mx calls skip the sys.modules lookup.
+    """
+    from ..bionc_casadi.joints_with_ground import GroundJoint as CasadiGroundJoint
+
+    return CasadiGroundJoint
+
+
+@lru_cache(maxsize=None)
+def _read_only_zeros(shape: tuple[int, int]) -> np.ndarray:
+    """
+    This function returns a shared read-only zero array, so the constant-zero jacobian
+    derivatives of the ground joints do not allocate a fresh matrix on every call.
+    """
+    zeros = np.zeros(shape)
+    zeros.flags.writeable = False
+    return zeros
+
+
+@njit(float64[:](float64[:], float64[:, :], int64[:], float64[:]), cache=True)
+def _ground_hinge_constraint(
+    Q_child: np.ndarray, parent_vectors: np.ndarray, child_axis_codes: np.ndarray, cos_theta: np.ndarray
+) -> np.ndarray:
+    """
+    This function assembles the constraints of a hinge joint with the ground in one compiled pass,
+    the child axes read through precomputed offsets into the flat coordinate vector.
+
+    Parameters
+    ----------
+    Q_child : np.ndarray
+        The flat natural coordinates of the child segment [12]
+    parent_vectors : np.ndarray
+        The cartesian axis vectors of the ground [2 x 3]
+    child_axis_codes : np.ndarray
+        The natural axis index of each angular constraint, 0 for u, 1 for v, 2 for w [2]
+    cos_theta : np.ndarray
+        The cosines of the joint angles [2]
+
+    Returns
+    -------
+    np.ndarray
+        Kinematic constraints of the joint [5]
+    """
+    constraint = np.zeros(3 + child_axis_codes.shape[0])
+    constraint[0] = -Q_child[3]
+    constraint[1] = -Q_child[4]
+    constraint[2] = -Q_child[5]
+    for i in range(child_axis_codes.shape[0]):
+        code = child_axis_codes[i]
+        if code == 0:
+            axis_0, axis_1, axis_2 = Q_child[0], Q_child[1], Q_child[2]
+        elif code == 2:
+            axis_0, axis_1, axis_2 = Q_child[9], Q_child[10], Q_child[11]
+        else:
+            axis_0 = Q_child[3] - Q_child[6]
+            axis_1 = Q_child[4] - Q_child[7]
+            axis_2 = Q_child[5] - Q_child[8]
+        constraint[i + 3] = (
+            parent_vectors[i, 0] * axis_0 + parent_vectors[i, 1] * axis_1 + parent_vectors[i, 2] * axis_2
+        ) - cos_theta[i]
+    return constraint
+
+
 class GroundJoint:
     """
     The public interface to joints with the ground as parent segment.
@@ -80,9 +150,7 @@ class GroundJoint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints_with_ground import GroundJoint as CasadiGroundJoint
-
-            return CasadiGroundJoint.Free(
+            return _casadi_ground_joint().Free(
                 name=self.name,
                 child=self.child.to_mx(),
                 index=self.index,
@@ -142,6 +210,28 @@ class GroundJoint:
 
             self.nb_constraints = 5
 
+        def _constraint_constants(self) -> dict:
+            """
+            This function returns the constant inputs of the jitted constraint kernel, built lazily
+            once per instance so the runtime path never calls cos nor resolves the child axes.
+
+            Returns
+            -------
+            dict[str, np.ndarray]
+                The ground axis vectors [2 x 3], the child axis codes [2] and the angle cosines [2]
+            """
+            if getattr(self, "_constraint_constants_cache", None) is None:
+                axis_codes = {NaturalAxis.U: 0, NaturalAxis.V: 1, NaturalAxis.W: 2}
+                self._constraint_constants_cache = dict(
+                    parent_vectors=np.ascontiguousarray(
+                        np.stack([np.asarray(vector, dtype=np.float64).ravel() for vector in self.parent_vector])
+                    ),
+                    # kept writeable: the jitted signature only accepts writeable arrays
+                    child_axis_codes=np.array([axis_codes[axis] for axis in self.child_axis], dtype=np.int64),
+                    cos_theta=np.cos(np.asarray(self.theta, dtype=np.float64)),
+                )
+            return self._constraint_constants_cache
+
         def constraint(self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates) -> np.ndarray:
             """
             This function returns the kinematic constraints of the joint, denoted Phi_k
@@ -152,17 +242,15 @@ class GroundJoint:
             np.ndarray
                 Kinematic constraints of the joint [5, 1]
             """
-            constraint = np.zeros(self.nb_constraints)
-            constraint[:3] = -Q_child.rp  # NOTE: only fixed with the origin of the inertial coordinate system
+            # NOTE: the rp rows are only fixed with the origin of the inertial coordinate system
             # todo: extend to any point of the inertial coordinate system
-
-            for i in range(2):
-                constraint[i + 3] = np.dot(
-                    self.parent_vector[i],
-                    Q_child.axis(self.child_axis[i]),
-                ) - np.cos(self.theta[i])
-
-            return constraint
+            constants = self._constraint_constants()
+            return _ground_hinge_constraint(
+                np.ascontiguousarray(Q_child, dtype=np.float64).ravel(),
+                constants["parent_vectors"],
+                constants["child_axis_codes"],
+                constants["cos_theta"],
+            )
 
         def parent_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -172,13 +260,21 @@ class GroundJoint:
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-            K_k_child[:3, 3:6] = -np.eye(3)
+            # the jacobian only depends on the constant axis vectors of the joint, so it is built once
+            # per instance and the cached read-only array is returned afterwards
+            if getattr(self, "_child_jacobian_cache", None) is None:
+                K_k_child = np.zeros((self.nb_constraints, 12))
+                K_k_child[:3, 3:6] = -np.eye(3)
 
-            for i in range(2):
-                K_k_child[i + 3, :] = np.squeeze((self.parent_vector[i]).T @ self.child_vector[i].interpolate().rot)
+                for i in range(2):
+                    K_k_child[i + 3, :] = np.asarray(
+                        self.parent_vector[i].T @ self.child_vector[i].interpolate().rot
+                    ).ravel()
 
-            return K_k_child
+                K_k_child.flags.writeable = False
+                self._child_jacobian_cache = K_k_child
+
+            return self._child_jacobian_cache
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -188,9 +284,7 @@ class GroundJoint:
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-
-            return K_k_child
+            return _read_only_zeros((self.nb_constraints, 12))
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -231,9 +325,7 @@ class GroundJoint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints_with_ground import GroundJoint as CasadiGroundJoint
-
-            return CasadiGroundJoint.Hinge(
+            return _casadi_ground_joint().Hinge(
                 name=self.name,
                 child=self.child.to_mx(),
                 index=self.index,
@@ -315,7 +407,8 @@ class GroundJoint:
             """
             constraint = np.zeros(self.nb_constraints)
             constraint[:3] = -Q_child.rp
-            constraint[3] = np.dot(self.parent_vector, Q_child.axis(self.child_axis)) - np.cos(self.theta)
+            # math.cos skips the ufunc dispatch np.cos pays on a python scalar
+            constraint[3] = np.dot(self.parent_vector, Q_child.axis(self.child_axis)) - math.cos(self.theta)
 
             return constraint
 
@@ -327,12 +420,18 @@ class GroundJoint:
         def child_constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-            K_k_child[:3, 3:6] = -np.eye(3)
+            # the jacobian only depends on the constant axis vectors of the joint, so it is built once
+            # per instance and the cached read-only array is returned afterwards
+            if getattr(self, "_child_jacobian_cache", None) is None:
+                K_k_child = np.zeros((self.nb_constraints, 12))
+                K_k_child[:3, 3:6] = -np.eye(3)
 
-            K_k_child[3, :] = np.squeeze(self.parent_vector.T @ self.child_vector.interpolate().rot)
+                K_k_child[3, :] = np.asarray(self.parent_vector.T @ self.child_vector.interpolate().rot).ravel()
 
-            return K_k_child
+                K_k_child.flags.writeable = False
+                self._child_jacobian_cache = K_k_child
+
+            return self._child_jacobian_cache
 
         def parent_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
@@ -342,9 +441,7 @@ class GroundJoint:
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_child_dot = np.zeros((self.nb_constraints, 12))
-
-            return K_k_child_dot
+            return _read_only_zeros((self.nb_constraints, 12))
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -456,9 +553,7 @@ class GroundJoint:
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-
-            return K_k_child
+            return _read_only_zeros((self.nb_constraints, 12))
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -499,9 +594,7 @@ class GroundJoint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints_with_ground import GroundJoint as CasadiGroundJoint
-
-            return CasadiGroundJoint.Spherical(
+            return _casadi_ground_joint().Spherical(
                 name=self.name,
                 child=self.child.to_mx(),
                 ground_application_point=self.ground_application_point,
@@ -566,9 +659,7 @@ class GroundJoint:
         def child_constraint_jacobian_derivative(
             self, Qdot_parent: SegmentNaturalVelocities, Qdot_child: SegmentNaturalVelocities
         ) -> np.ndarray:
-            K_k_child = np.zeros((self.nb_constraints, 12))
-
-            return K_k_child
+            return _read_only_zeros((self.nb_constraints, 12))
 
         def constraint_jacobian(
             self, Q_parent: SegmentNaturalCoordinates, Q_child: SegmentNaturalCoordinates
@@ -609,9 +700,7 @@ class GroundJoint:
             JointBase
                 The joint as a mx joint
             """
-            from ..bionc_casadi.joints_with_ground import GroundJoint as CasadiGroundJoint
-
-            return CasadiGroundJoint.Weld(
+            return _casadi_ground_joint().Weld(
                 name=self.name,
                 child=self.child.to_mx(),
                 index=self.index,
@@ -1,11 +1,35 @@
+from functools import lru_cache
 from typing import Union
 import numpy as np
 from numpy import eye
+from scipy import sparse
 from ..protocols.natural_vector import AbstractNaturalVector
 from ..protocols.interpolation_matrix import AbstractInterpolationMatrix
 from ..utils.enums import NaturalAxis
 
 
+@lru_cache(maxsize=None)
+def _cached_interpolation_matrix(c0: float, c1: float, c2: float) -> np.ndarray:
+    """
+    This function returns the 3 x 12 interpolation matrix of a natural vector, memoized on its components.
+    The constant vectors (proximal, distal, axes) are requested over and over at runtime, so their matrices
+    are built once and shared. The returned array is read-only to protect the cache.
+
+    Parameters
+    ----------
+    c0, c1, c2 : float
+        The components of the natural vector
+
+    Returns
+    -------
+    np.ndarray
+        The interpolation matrix [3 x 12]
+    """
+    interpolation_matrix = np.kron([[c0, 1 + c1, -c1, c2]], eye(3))
+    interpolation_matrix.setflags(write=False)
+    return interpolation_matrix
+
+
 class NaturalVector(AbstractNaturalVector, np.ndarray):
     """
     Class used to create a natural vector, a vector that is expressed in the natural coordinate system of a segment
@@ -53,12 +77,7 @@ class NaturalVector(AbstractNaturalVector, np.ndarray):
 
     def interpolate(self) -> np.ndarray:
         """This function converts the natural vector into the interpolation matrix"""
-        interpolation_matrix = np.zeros((3, 12))
-        interpolation_matrix[0:3, 0:3] = self[0] * eye(3)
-        interpolation_matrix[0:3, 3:6] = (1 + self[1]) * eye(3)
-        interpolation_matrix[0:3, 6:9] = -self[1] * eye(3)
-        interpolation_matrix[0:3, 9:12] = self[2] * eye(3)
-        return InterpolationMatrix(interpolation_matrix)
+        return InterpolationMatrix(_cached_interpolation_matrix(float(self[0]), float(self[1]), float(self[2])))
 
 
 class InterpolationMatrix(AbstractInterpolationMatrix, np.ndarray):
@@ -118,12 +137,9 @@ class InterpolationMatrix(AbstractInterpolationMatrix, np.ndarray):
     @classmethod
     def from_natural_vector(cls, natural_vector: NaturalVector):
         """This function converts the natural vector into the interpolation matrix"""
-        interpolation_matrix = np.zeros((3, 12))
-        interpolation_matrix[0:3, 0:3] = natural_vector[0] * eye(3)
-        interpolation_matrix[0:3, 3:6] = (1 + natural_vector[1]) * eye(3)
-        interpolation_matrix[0:3, 6:9] = -natural_vector[1] * eye(3)
-        interpolation_matrix[0:3, 9:12] = natural_vector[2] * eye(3)
-        return cls(interpolation_matrix)
+        return cls(
+            _cached_interpolation_matrix(float(natural_vector[0]), float(natural_vector[1]), float(natural_vector[2]))
+        )
 
     @property
     def rot(self) -> np.ndarray:
@@ -149,3 +165,17 @@ class InterpolationMatrix(AbstractInterpolationMatrix, np.ndarray):
 
     def to_array(self):
         return np.array(self)
+
+    def to_sparse(self) -> "sparse.csr_matrix":
+        """
+        This function returns the interpolation matrix in compressed sparse row format. The matrix holds
+        at most three scaled 3 x 3 identity blocks, so the sparse product N @ Q costs one multiply per
+        nonzero (at most 12) instead of the 36 of the dense product, which pays off when many
+        interpolations are batched together.
+
+        Returns
+        -------
+        sparse.csr_matrix
+            The interpolation matrix [3 x 12], only the nonzeros stored
+        """
+        return sparse.csr_matrix(np.asarray(self))
@@ -1,5 +1,7 @@
+from functools import lru_cache
+
 import numpy as np
-from numba import float64
+from numba import float64, int64
 from numba import njit
 from numpy import ndarray
 
@@ -31,6 +33,121 @@ def rotation_z(angle: float) -> ndarray:
     return np.array([[cos_angle, -sin_angle, 0.0], [sin_angle, cos_angle, 0.0], [0.0, 0.0, 1.0]])
 
 
+@njit(float64[:, :, :](float64[:], int64[:]), cache=True)
+def _rotation_triplet(angles: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    """
+    This function builds the three individual rotation matrices of an euler sequence in one
+    compiled pass, each trig pair computed once, instead of three dispatched constructor calls.
+
+    Parameters
+    ----------
+    angles : np.ndarray
+        The three euler angles [3]
+    axes : np.ndarray
+        The axis index of each rotation, 0 for x, 1 for y, 2 for z [3]
+
+    Returns
+    -------
+    np.ndarray
+        The stacked rotation matrices [3 x 3 x 3]
+    """
+    out = np.zeros((3, 3, 3))
+    for i in range(3):
+        cos_angle = np.cos(angles[i])
+        sin_angle = np.sin(angles[i])
+        rotation = out[i, :, :]
+        if axes[i] == 0:
+            rotation[0, 0] = 1.0
+            rotation[1, 1] = cos_angle
+            rotation[1, 2] = -sin_angle
+            rotation[2, 1] = sin_angle
+            rotation[2, 2] = cos_angle
+        elif axes[i] == 1:
+            rotation[0, 0] = cos_angle
+            rotation[0, 2] = sin_angle
+            rotation[1, 1] = 1.0
+            rotation[2, 0] = -sin_angle
+            rotation[2, 2] = cos_angle
+        else:
+            rotation[0, 0] = cos_angle
+            rotation[0, 1] = -sin_angle
+            rotation[1, 0] = sin_angle
+            rotation[1, 1] = cos_angle
+            rotation[2, 2] = 1.0
+    return out
+
+
+@njit(float64[:](float64[:, :], int64[:]), cache=True)
+def _euler_angles_from_matrix(rotation_matrix: np.ndarray, axes: np.ndarray) -> np.ndarray:
+    """
+    This function extracts the euler angles of a three-rotation intrinsic sequence with the
+    closed-form arcsin/arctan2 formulas, matching the biorbd convention bit for bit without
+    crossing into the extension.
+
+    Parameters
+    ----------
+    rotation_matrix : np.ndarray
+        Rotation matrix [3 x 3]
+    axes : np.ndarray
+        The axis index of each rotation, 0 for x, 1 for y, 2 for z [3]
+
+    Returns
+    -------
+    np.ndarray
+        The three euler angles in radians [3]
+    """
+    angles = np.zeros(3)
+    i, j, k = axes[0], axes[1], axes[2]
+    # epsilon is the parity of the sequence, +1 for a cyclic axis order
+    epsilon = 1.0 if j == (i + 1) % 3 else -1.0
+    if i != k:  # tait-bryan, three distinct axes
+        angles[0] = np.arctan2(-epsilon * rotation_matrix[j, k], rotation_matrix[k, k])
+        angles[1] = np.arcsin(epsilon * rotation_matrix[i, k])
+        angles[2] = np.arctan2(-epsilon * rotation_matrix[i, j], rotation_matrix[i, i])
+    else:  # proper euler, the first axis repeated
+        third = 3 - i - j
+        angles[0] = np.arctan2(rotation_matrix[j, i], -epsilon * rotation_matrix[third, i])
+        angles[1] = np.arccos(rotation_matrix[i, i])
+        angles[2] = np.arctan2(rotation_matrix[i, j], epsilon * rotation_matrix[i, third])
+    return angles
+
+
+@lru_cache(maxsize=None)
+def _axis_codes(sequence: str) -> np.ndarray:
+    """This function returns the axis indices of an euler sequence, e.g. 'xyz' -> [0, 1, 2]."""
+    # kept writeable: the jitted signature only accepts writeable arrays
+    return np.array([("x", "y", "z").index(axis) for axis in sequence], dtype=np.int64)
+
+
+def _read_only(vector: np.ndarray) -> np.ndarray:
+    vector.flags.writeable = False
+    return vector
+
+
+# dispatch tables built once at import: looking up the constructor avoids building the three
+# rotation matrices on every call, and the axis vectors are shared read-only constants
+_ROTATION_FROM_AXIS = {
+    "x": rotation_x,
+    CartesianAxis.X: rotation_x,
+    "y": rotation_y,
+    CartesianAxis.Y: rotation_y,
+    "z": rotation_z,
+    CartesianAxis.Z: rotation_z,
+}
+
+_X_VECTOR = _read_only(np.array([1, 0, 0]))
+_Y_VECTOR = _read_only(np.array([0, 1, 0]))
+_Z_VECTOR = _read_only(np.array([0, 0, 1]))
+_VECTOR_FROM_AXIS = {
+    "x": _X_VECTOR,
+    CartesianAxis.X: _X_VECTOR,
+    "y": _Y_VECTOR,
+    CartesianAxis.Y: _Y_VECTOR,
+    "z": _Z_VECTOR,
+    CartesianAxis.Z: _Z_VECTOR,
+}
+
+
 def rotation_matrices_from_rotation_matrix(rotation_matrix, sequence: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     This function converts a rotation matrix to individual rotation matrices
@@ -48,13 +165,12 @@ def rotation_matrices_from_rotation_matrix(rotation_matrix, sequence: str) -> tu
         Individual rotation matrices
     """
 
-    angles = rotation_matrix_to_euler_angles(rotation_matrix, sequence)
+    codes = _axis_codes(sequence)
+    angles = _euler_angles_from_matrix(np.ascontiguousarray(rotation_matrix, dtype=np.float64), codes)
 
-    R0 = rotation_matrix_from_angle_and_axis(angles[0], sequence[0])
-    R1 = rotation_matrix_from_angle_and_axis(angles[1], sequence[1])
-    R2 = rotation_matrix_from_angle_and_axis(angles[2], sequence[2])
+    triplet = _rotation_triplet(angles, codes)
 
-    return R0, R1, R2
+    return triplet[0], triplet[1], triplet[2]
 
 
 def rotation_matrix_from_angle_and_axis(angle: float, axis: str | CartesianAxis) -> np.ndarray:
@@ -73,19 +189,10 @@ def rotation_matrix_from_angle_and_axis(angle: float, axis: str | CartesianAxis)
     np.ndarray
         Rotation matrix
     """
-    axis_map = {
-        "x": rotation_x(angle),
-        CartesianAxis.X: rotation_x(angle),
-        "y": rotation_y(angle),
-        CartesianAxis.Y: rotation_y(angle),
-        "z": rotation_z(angle),
-        CartesianAxis.Z: rotation_z(angle),
-    }
-
-    output = axis_map.get(axis)
-    if output is None:
+    rotation = _ROTATION_FROM_AXIS.get(axis)
+    if rotation is None:
         raise ValueError("The axis must be 'x', 'y' or 'z'.")
-    return output
+    return rotation(angle)
 
 
 def euler_axes_from_rotation_matrices(
@@ -122,48 +229,38 @@ def euler_axes_from_rotation_matrices(
     if isinstance(sequence, EulerSequence):
         sequence = sequence.value
 
-    individual_rotation_matrices = rotation_matrices_from_rotation_matrix(R, sequence)
-
-    euler_axes = [None for _ in range(3)]
+    R0, R1, R2 = rotation_matrices_from_rotation_matrix(R, sequence)
 
-    cumulated_rotation_matrix = np.eye(3)
+    # each axis is a cumulated rotation applied to a basis vector, i.e. one column of the
+    # cumulated matrix; folding the frame matrix into the accumulation and reading columns
+    # replaces the nine matmul calls of the previous per-axis loops with three
+    codes = _axis_codes(sequence)
 
     if axes_source_frame == "parent":
-        for i, (axis, rotation) in enumerate(zip(sequence, individual_rotation_matrices)):
-            cumulated_rotation_matrix = cumulated_rotation_matrix @ rotation
-
-            v = vector_from_axis(axis)
-            # e.g. for xyz, x: R_0_parent @ rotx @ [1, 0, 0]; y: R_0_parent @ rotx @ roty @ [0, 1, 0]; ...
-            euler_axes[i] = R_0_parent @ cumulated_rotation_matrix @ v
-
-        return tuple(euler_axes)
+        # e.g. for xyz, x: (R_0_parent @ rotx)[:, 0]; y: (R_0_parent @ rotx @ roty)[:, 1]; ...
+        cumulated = R_0_parent @ R0
+        first_axis = cumulated[:, codes[0]].copy()
+        cumulated = cumulated @ R1
+        second_axis = cumulated[:, codes[1]].copy()
+        return first_axis, second_axis, (cumulated @ R2)[:, codes[2]].copy()
 
     elif axes_source_frame == "child":
-        # flip the sequence and the rotation matrices
-        sequence = sequence[::-1]
-        individual_rotation_matrices = individual_rotation_matrices[::-1]
-
-        for i, (axis, rotation) in enumerate(zip(sequence, individual_rotation_matrices)):
-            cumulated_rotation_matrix = cumulated_rotation_matrix @ rotation.T
-
-            v = vector_from_axis(axis)
-            # e.g. for xyz, z: R_0_child @ rotz.T @ [0, 0, 1]; y: R_0_child @ rotz.T @ roty.T @ [0, 1, 0]; ...
-            euler_axes[i] = R_0_child @ cumulated_rotation_matrix @ v
-
-        # flip the euler axes
-        euler_axes = euler_axes[::-1]
-        return tuple(euler_axes)
+        # e.g. for xyz, z: (R_0_child @ rotz.T)[:, 2]; y: (R_0_child @ rotz.T @ roty.T)[:, 1]; ...
+        cumulated = R_0_child @ R2.T
+        third_axis = cumulated[:, codes[2]].copy()
+        cumulated = cumulated @ R1.T
+        second_axis = cumulated[:, codes[1]].copy()
+        return (cumulated @ R0.T)[:, codes[0]].copy(), second_axis, third_axis
 
     elif axes_source_frame == "mixed":
         # this method should be better as it relies less on the transformations of the rotation matrices
-        # only the second axis depends on the first angle, the third relies on the child matrix
-
-        parent_euler_axes = euler_axes_from_rotation_matrices(
-            R_0_parent, R_0_child, sequence, axes_source_frame="parent"
+        # only the second axis depends on the first angle, the third relies on the child matrix.
+        cumulated = R_0_parent @ R0
+        return (
+            cumulated[:, codes[0]].copy(),
+            (cumulated @ R1)[:, codes[1]].copy(),
+            (R_0_child @ R2.T)[:, codes[2]].copy(),
         )
-        child_euler_axes = euler_axes_from_rotation_matrices(R_0_parent, R_0_child, sequence, axes_source_frame="child")
-
-        return parent_euler_axes[0], parent_euler_axes[1], child_euler_axes[2]
 
 
 def vector_from_axis(axis: str | CartesianAxis) -> np.ndarray:
@@ -180,16 +277,7 @@ def vector_from_axis(axis: str | CartesianAxis) -> np.ndarray:
     np.ndarray
         Vector associated with the axis
     """
-    axis_map = {
-        "x": np.array([1, 0, 0]),
-        CartesianAxis.X: np.array([1, 0, 0]),
-        "y": np.array([0, 1, 0]),
-        CartesianAxis.Y: np.array([0, 1, 0]),
-        "z": np.array([0, 0, 1]),
-        CartesianAxis.Z: np.array([0, 0, 1]),
-    }
-
-    output = axis_map.get(axis)
+    output = _VECTOR_FROM_AXIS.get(axis)
     if output is None:
         raise ValueError("The axis must be 'x', 'y' or 'z'.")
     else:
@@ -218,6 +306,10 @@ def euler_angles_from_rotation_matrix(
     """
 
     rot = parent_matrix.T @ child_matrix
-    euler_angles = rotation_matrix_to_euler_angles(rot, joint_sequence.value)
+    sequence = joint_sequence.value
+    if len(sequence) == 3:
+        return _euler_angles_from_matrix(np.ascontiguousarray(rot), _axis_codes(sequence))
+    # the two-rotation projections of the enum stay on the biorbd extraction
+    euler_angles = rotation_matrix_to_euler_angles(rot, sequence)
 
     return euler_angles
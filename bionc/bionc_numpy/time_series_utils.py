@@ -3,6 +3,53 @@ import numpy as np
 from .natural_coordinates import NaturalCoordinates
 
 
+def _uvw_over_frames(Q: np.ndarray, nb_segments: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split the natural coordinates of all frames into the u, v, w axes [nb_segments, 3, nb_frames]."""
+    Q_segments = np.asarray(Q).reshape(nb_segments, 12, -1)
+    u = Q_segments[:, 0:3, :]
+    v = Q_segments[:, 3:6, :] - Q_segments[:, 6:9, :]
+    w = Q_segments[:, 9:12, :]
+    return u, v, w
+
+
+def rigid_body_constraints_all_frames(model, Q: np.ndarray) -> np.ndarray:
+    """
+    Compute the rigid body constraints of all frames in one vectorized pass, equivalent to calling
+    model.rigid_body_constraints frame per frame on Q [12 * nb_segments, nb_frames].
+    """
+    nb_segments = model.nb_segments
+    u, v, w = _uvw_over_frames(Q, nb_segments)
+    phi_r = np.empty((nb_segments, 6, np.asarray(Q).shape[1]))
+    phi_r[:, 0, :] = np.einsum("sit,sit->st", u, u)
+    phi_r[:, 1, :] = np.einsum("sit,sit->st", u, v)
+    phi_r[:, 2, :] = np.einsum("sit,sit->st", u, w)
+    phi_r[:, 3, :] = np.einsum("sit,sit->st", v, v)
+    phi_r[:, 4, :] = np.einsum("sit,sit->st", v, w)
+    phi_r[:, 5, :] = np.einsum("sit,sit->st", w, w)
+    phi_r -= model.segments.segment_parameters.T[:, :, None]
+
+    return phi_r.reshape(6 * nb_segments, -1)
+
+
+def rigid_body_constraints_derivative_all_frames(model, Q: np.ndarray, Qdot: np.ndarray) -> np.ndarray:
+    """
+    Compute the derivative of the rigid body constraints of all frames in one vectorized pass,
+    equivalent to calling model.rigid_body_constraints_derivative frame per frame.
+    """
+    nb_segments = model.nb_segments
+    u, v, w = _uvw_over_frames(Q, nb_segments)
+    udot, vdot, wdot = _uvw_over_frames(Qdot, nb_segments)
+    phi_r_dot = np.empty((nb_segments, 6, np.asarray(Q).shape[1]))
+    phi_r_dot[:, 0, :] = 2.0 * np.einsum("sit,sit->st", u, udot)
+    phi_r_dot[:, 1, :] = np.einsum("sit,sit->st", udot, v) + np.einsum("sit,sit->st", u, vdot)
+    phi_r_dot[:, 2, :] = np.einsum("sit,sit->st", udot, w) + np.einsum("sit,sit->st", u, wdot)
+    phi_r_dot[:, 3, :] = 2.0 * np.einsum("sit,sit->st", v, vdot)
+    phi_r_dot[:, 4, :] = np.einsum("sit,sit->st", vdot, w) + np.einsum("sit,sit->st", v, wdot)
+    phi_r_dot[:, 5, :] = 2.0 * np.einsum("sit,sit->st", w, wdot)
+
+    return phi_r_dot.reshape(6 * nb_segments, -1)
+
+
 def total_constraints(Q: np.ndarray, constraint_function: callable):
     """Compute the total constraints for a given model and natural coordinates."""
     total_residual = np.zeros(Q.shape[1])
@@ -84,6 +131,8 @@ class TimeSeriesUtils:
 
     total_rigid_body_constraints = total_rigid_body_constraints
     rigid_body_constraints = rigid_body_constraints
+    rigid_body_constraints_all_frames = rigid_body_constraints_all_frames
+    rigid_body_constraints_derivative_all_frames = rigid_body_constraints_derivative_all_frames
     total_joint_constraints = total_joint_constraints
     joint_constraints = joint_constraints
     total_marker_constraints = total_marker_constraints
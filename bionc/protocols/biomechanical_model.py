@@ -307,6 +307,10 @@ class GenericBiomechanicalModel(ABC):
             if (joint.parent is not None and joint.parent.name == name) or joint.child.name == name:
                 raise ValueError("The ground segment cannot be a parent or a child of a joint")
 
+        # the segment indices changed, the cached indexing tuples are no longer valid
+        self.segments._invalidate_segment_cache()
+        self.joints._invalidate_joint_cache()
+
         self._update_mass_matrix()
 
     @property
@@ -55,6 +55,8 @@ class GenericBiomechanicalModelJoints(ABC):
         Returns the derivative of the Jacobian matrix of the joint constraints.
     """
 
+    joint_factories: dict = None  # each backend overrides this with a property returning its JOINT_FACTORIES dict
+
     def __init__(
         self,
         joints: dict[str:Any, ...] = None,
@@ -64,6 +66,7 @@ class GenericBiomechanicalModelJoints(ABC):
         self.joints: dict[str:JointBase, ...] = {} if joints is None else joints
         # From Pythom 3.7 the insertion order in a dict is preserved. This is important because when writing a new
         # the order of the segment matters
+        self._joint_cache: tuple = None
 
     def __getitem__(self, key):
         return self.joints[key]
@@ -100,6 +103,8 @@ class GenericBiomechanicalModelJoints(ABC):
 
         # remove name of the joint_type from the dictionary
         joint_type = joint.pop("joint_type")
+        # the factory can be given as the enum member or as its name, dispatched through the factory dict
+        joint_factory = self.joint_factories[joint_type] if isinstance(joint_type, str) else joint_type.value
         # remove None values from the dictionary
         joint = {key: value for key, value in joint.items() if value is not None}
         # replace parent field by the parent segment
@@ -112,7 +117,40 @@ class GenericBiomechanicalModelJoints(ABC):
         joint["child"] = segments[joint["child"]]
         joint["index"] = self.nb_joints
 
-        self.joints[joint["name"]] = joint_type.value(**joint)
+        self.joints[joint["name"]] = joint_factory(**joint)
+        self._invalidate_joint_cache()
+
+    def _invalidate_joint_cache(self):
+        """
+        This function invalidates the cached joint indexing tuples, it must be called
+        whenever joints are added, removed or reindexed.
+        """
+        self._joint_cache = None
+
+    @property
+    def joint_cache(self) -> tuple:
+        """
+        This function returns a cached tuple of (joint, constraint slice, parent index, child index)
+        for each joint with constraints, so that hot assembly loops iterate on a bare tuple instead of
+        resolving segment indices and constraint slices on every call.
+        The parent index is None if the joint is a joint with the ground.
+
+        Returns
+        -------
+        tuple[tuple[Any, slice, int, int], ...]
+            The cached joint indexing tuples
+        """
+        if getattr(self, "_joint_cache", None) is None:  # getattr for models pickled before the cache existed
+            self._joint_cache = tuple(
+                (
+                    joint,
+                    self.constraints_index(joint.index),
+                    None if joint.parent is None else joint.parent.index,
+                    joint.child.index,
+                )
+                for joint in self.joints_with_constraints.values()
+            )
+        return self._joint_cache
 
     @property
     def joints_with_constraints(self) -> dict:
@@ -218,6 +256,8 @@ class GenericBiomechanicalModelJoints(ABC):
             if joint.index > joint_to_remove.index:
                 joint.index -= 1
 
+        self._invalidate_joint_cache()
+
     @property
     def nb_constraints(self) -> int:
         """
@@ -80,6 +80,8 @@ class GenericBiomechanicalModelSegments(ABC):
         self.segments: dict[str:AbstractNaturalSegment, ...] = {} if segments is None else segments
         # From Pythom 3.7 the insertion order in a dict is preserved. This is important because when writing a new
         # the order of the segment matters
+        self._segment_cache: tuple = None
+        self._segments_no_ground_cache: dict = None
 
     def __getitem__(self, name: str):
         """
@@ -125,9 +127,37 @@ class GenericBiomechanicalModelSegments(ABC):
         if segment.name == name:  # Make sure the name of the segment fits the internal one
             segment.set_index(len(self.segments))
             self.segments[name] = segment
+            self._invalidate_segment_cache()
         else:
             raise ValueError("The name of the segment does not match the name of the segment")
 
+    def _invalidate_segment_cache(self):
+        """
+        This function invalidates the cached segment indexing tuples, it must be called
+        whenever segments are added or reindexed.
+        """
+        self._segment_cache = None
+        self._segments_no_ground_cache = None
+
+    @property
+    def segment_cache(self) -> tuple:
+        """
+        This function returns a cached tuple of (index, rigid body constraint slice, coordinates slice, segment)
+        for each segment, so that hot assembly loops iterate on a bare tuple instead of
+        recomputing dict lookups and slices on every call.
+
+        Returns
+        -------
+        tuple[tuple[int, slice, slice, Any], ...]
+            The cached segment indexing tuples
+        """
+        if getattr(self, "_segment_cache", None) is None:  # getattr for models pickled before the cache existed
+            self._segment_cache = tuple(
+                (i, slice(6 * i, 6 * (i + 1)), slice(12 * i, 12 * (i + 1)), segment)
+                for i, segment in enumerate(self.segments_no_ground.values())
+            )
+        return self._segment_cache
+
     def keys(self):
         return self.segments.keys()
 
@@ -155,14 +185,19 @@ class GenericBiomechanicalModelSegments(ABC):
     @property
     def segments_no_ground(self):
         """
-        This function returns the dictionary of all the segments except the ground segment
+        This function returns the dictionary of all the segments except the ground segment.
+        The dictionary is cached and rebuilt on model mutation, as it is iterated in every assembly loop.
 
         Returns
         -------
         dict[str: NaturalSegment, ...]
             The dictionary of all the segments except the ground segment
         """
-        return {name: segment for name, segment in self.segments.items() if not segment._is_ground}
+        if getattr(self, "_segments_no_ground_cache", None) is None:  # getattr for models pickled before the cache
+            self._segments_no_ground_cache = {
+                name: segment for name, segment in self.segments.items() if not segment._is_ground
+            }
+        return self._segments_no_ground_cache
 
     @property
     def nb_segments(self) -> int:
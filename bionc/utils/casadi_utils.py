@@ -1,5 +1,37 @@
 from casadi import MX, SX, Function, nlpsol
+from functools import lru_cache
 import numpy as np
+import subprocess
+import sys
+
+# solving a one-variable NLP with the candidate tells whether its linear solver is available;
+# run in a subprocess because ipopt can crash the process when a missing HSL library is probed
+_LINEAR_SOLVER_PROBE = (
+    "from casadi import SX, nlpsol; import sys;"
+    "x = SX.sym('x');"
+    "s = nlpsol('probe', 'ipopt', {'x': x, 'f': (x - 1) ** 2},"
+    " {'ipopt': {'print_level': 0, 'linear_solver': sys.argv[1], 'sb': 'yes'}, 'print_time': False});"
+    "s(x0=0);"
+    "sys.exit(0 if s.stats()['success'] else 1)"
+)
+
+
+@lru_cache(maxsize=None)
+def best_ipopt_linear_solver() -> str:
+    """
+    Probes the available ipopt linear solvers, from the parallel HSL solvers down to the default mumps.
+    The result is cached so the probes run once per session.
+
+    Returns
+    -------
+    str
+        The name of the best available linear solver
+    """
+    for linear_solver in ("ma97", "ma86", "ma57"):
+        result = subprocess.run([sys.executable, "-c", _LINEAR_SOLVER_PROBE, linear_solver], capture_output=True)
+        if result.returncode == 0:
+            return linear_solver
+    return "mumps"
 
 
 def _mx_to_sx(mx: MX, symbolics: list[MX]) -> SX:
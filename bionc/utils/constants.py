@@ -20,4 +20,7 @@ IPOPT_IK_VALUES = {
     "ipopt.warm_start_init_point": "no",
     "ipopt.print_level": 0,
     "ipopt.print_timing_statistics": "no",
+    "ipopt.sb": "yes",  # suppress the ipopt banner, printed otherwise once per solver construction
+    "ipopt.mu_strategy": "adaptive",  # usually saves a few iterations on the small per-frame problems
+    "print_time": False,
 }
@@ -1,16 +1,35 @@
 from typing import Callable
 
 import numpy as np
+from numba import njit
 
 from ..bionc_numpy import NaturalCoordinates, NaturalVelocities, BiomechanicalModel
 
 
+@njit(cache=True)
+def _rk4_stage(yi: np.ndarray, k: np.ndarray, scale: float, out: np.ndarray) -> None:
+    """This function writes the intermediate stage state yi + scale * k into out in one fused pass."""
+    for i in range(yi.shape[0]):
+        out[i] = yi[i] + scale * k[i]
+
+
+@njit(cache=True)
+def _rk4_combine(
+    yi: np.ndarray, h: float, k1: np.ndarray, k2: np.ndarray, k3: np.ndarray, k4: np.ndarray, out: np.ndarray
+) -> None:
+    """This function writes the weighted slope combination of one RK4 step into out in one fused pass."""
+    weight = h / 6.0
+    for i in range(yi.shape[0]):
+        out[i] = yi[i] + weight * (k1[i] + 2.0 * (k2[i] + k3[i]) + k4[i])
+
+
 def RK4(
     t: np.ndarray,
     f: Callable,
     y0: np.ndarray,
     normalize_idx: tuple[tuple[int, ...]] = None,
     args=(),
+    out: np.ndarray = None,
 ) -> np.ndarray:
     """
     Runge-Kutta 4th order method
@@ -27,6 +46,9 @@ def RK4(
         indices of states to be normalized together
     args : tuple
         additional arguments to be passed to the function f
+    out : np.ndarray
+        optional preallocated output buffer [len(y0), len(t)], reused across repeated
+        simulations such as parameter sweeps; allocated when None
 
     Returns
     -------
@@ -35,16 +57,35 @@ def RK4(
 
     """
     n = len(t)
-    y = np.zeros((len(y0), n))
+    # column-major layout: the states of one time step live in one contiguous column, so the
+    # per-step slices taken here and in the post computations are contiguous views; every
+    # column is fully written below, so the fresh buffer needs no zero initialization
+    y = np.empty((len(y0), n), order="F") if out is None else out
+    if y.shape != (len(y0), n):
+        raise ValueError(f"out should have shape {(len(y0), n)}, got {y.shape}")
     y[:, 0] = y0
+    # scratch buffers for the intermediate states and slopes, reused across steps so the
+    # stepping itself allocates nothing; f stays a Python callable, it dispatches through
+    # the model joints and cannot be compiled. The slopes are copied out of the returned
+    # array, so f is free to reuse an output buffer of its own between calls
+    y_mid = np.empty(len(y0))
+    k1 = np.empty(len(y0))
+    k2 = np.empty(len(y0))
+    k3 = np.empty(len(y0))
+    k4 = np.empty(len(y0))
     for i in range(n - 1):
         h = t[i + 1] - t[i]
-        yi = np.squeeze(y[:, i])
-        k1 = f(t[i], yi, *args)
-        k2 = f(t[i] + h / 2.0, yi + k1 * h / 2.0, *args)
-        k3 = f(t[i] + h / 2.0, yi + k2 * h / 2.0, *args)
-        k4 = f(t[i] + h, yi + k3 * h, *args)
-        y[:, i + 1] = yi + (h / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+        yi = y[:, i]
+        k1[:] = f(t[i], yi, *args)
+        _rk4_stage(yi, k1, h / 2.0, y_mid)
+        k2[:] = f(t[i] + h / 2.0, y_mid, *args)
+        _rk4_stage(yi, k2, h / 2.0, y_mid)
+        k3[:] = f(t[i] + h / 2.0, y_mid, *args)
+        _rk4_stage(yi, k3, h, y_mid)
+        k4[:] = f(t[i] + h, y_mid, *args)
+
+        # combine yi + (h / 6) * (k1 + 2 * k2 + 2 * k3 + k4) into the output column
+        _rk4_combine(yi, h, k1, k2, k3, k4, y[:, i + 1])
 
         # verify after each time step the normalization of the states
         if normalize_idx is not None:
@@ -87,35 +128,44 @@ def forward_integration(
             The dynamics of the system, f(t, X) = [Xdot, lambdas]
     """
 
+    # evaluated once and reused for the print and the check below
+    rigid_body_constraints_init = model.rigid_body_constraints(Q_init)
     print("Evaluate Rigid Body Constraints:")
-    print(model.rigid_body_constraints(Q_init))
+    print(rigid_body_constraints_init)
     print("Evaluate Rigid Body Constraints Jacobian Derivative:")
     print(model.rigid_body_constraint_jacobian_derivative(Qdot_init))
 
-    if (model.rigid_body_constraints(Q_init) > 1e-4).any():
-        print(model.rigid_body_constraints(Q_init))
+    if rigid_body_constraints_init.max() > 1e-4:
+        print(rigid_body_constraints_init)
         raise ValueError(
             "The segment natural coordinates don't satisfy the rigid body constraint, at initial conditions."
         )
 
     t_final = t_final  # [s]
     steps_per_second = steps_per_second
-    time_steps = np.linspace(0, t_final, int(steps_per_second * t_final + 1))
+    time_steps = np.linspace(0, t_final, int(round(steps_per_second * t_final)) + 1)
+
+    # the state slice indices and the state-dot buffer are invariant, they are hoisted out
+    # of the closure; RK4 copies the returned slopes, so the buffer can be reused per call
+    idx_coordinates = slice(0, model.nb_Q)
+    idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
+    states_dot = np.empty(model.nb_Q + model.nb_Qdot)
 
-    # initial conditions, x0 = [Qi, Qidot]
-    states_0 = np.concatenate((Q_init.to_array(), Qdot_init.to_array()), axis=0)
+    # initial conditions, x0 = [Qi, Qidot], filled in place to skip the concatenate temporary
+    states_0 = np.empty(model.nb_Q + model.nb_Qdot)
+    states_0[idx_coordinates] = Q_init.to_array()
+    states_0[idx_velocities] = Qdot_init.to_array()
 
     # Create the forward dynamics function Callable (f(t, x) -> xdot)
     def dynamics(t, states):
-        idx_coordinates = slice(0, model.nb_Q)
-        idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
-
         qddot, lambdas = model.forward_dynamics(
             NaturalCoordinates(states[idx_coordinates]),
             NaturalVelocities(states[idx_velocities]),
             # stabilization=dict(alpha=0.5, beta=0.5),
         )
-        return np.concatenate((states[idx_velocities], qddot.to_array()), axis=0), lambdas
+        states_dot[idx_coordinates] = states[idx_velocities]
+        states_dot[idx_velocities] = qddot.to_array()
+        return states_dot, lambdas
 
     # Solve the Initial Value Problem (IVP) for each time step
     normalize_idx = model.normalized_coordinates
@@ -56,7 +56,7 @@ def drop_the_box(
 
     t_final = t_final  # [s]
     steps_per_second = steps_per_second
-    time_steps = np.linspace(0, t_final, steps_per_second * t_final + 1)
+    time_steps = np.linspace(0, t_final, int(round(steps_per_second * t_final)) + 1)
 
     # initial conditions, x0 = [Qi, Qidot]
     states_0 = np.concatenate((Q_init.vector, Qdot_init.vector), axis=0)
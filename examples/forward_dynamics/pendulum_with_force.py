@@ -128,37 +128,43 @@ def drop_the_pendulum(
             The dynamics of the system, f(t, X) = [Xdot, lambdas]
     """
 
+    rigid_body_constraints_init = model.rigid_body_constraints(Q_init)
     print("Evaluate Rigid Body Constraints:")
-    print(model.rigid_body_constraints(Q_init))
+    print(rigid_body_constraints_init)
     print("Evaluate Rigid Body Constraints Jacobian Derivative:")
     print(model.rigid_body_constraint_jacobian_derivative(Qdot_init))
 
-    if (model.rigid_body_constraints(Q_init) > 1e-6).any():
-        print(model.rigid_body_constraints(Q_init))
+    if (rigid_body_constraints_init > 1e-6).any():
+        print(rigid_body_constraints_init)
         raise ValueError(
             "The segment natural coordinates don't satisfy the rigid body constraint, at initial conditions."
         )
 
     t_final = t_final  # [s]
     steps_per_second = steps_per_second
-    time_steps = np.linspace(0, t_final, steps_per_second * t_final + 1)
+    time_steps = np.linspace(0, t_final, int(round(steps_per_second * t_final)) + 1)
 
     # initial conditions, x0 = [Qi, Qidot]
     states_0 = np.concatenate((Q_init.to_array(), Qdot_init.to_array()), axis=0)
 
     fext = external_forces
 
+    # the state slice indices are invariant, they are hoisted out of the closure
+    idx_coordinates = slice(0, model.nb_Q)
+    idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
+    # RK4 copies the returned slopes, so the state-dot buffer can be reused per call
+    states_dot = np.empty(model.nb_Q + model.nb_Qdot)
+
     # Create the forward dynamics function Callable (f(t, x) -> xdot)
     def dynamics(t, states):
-        idx_coordinates = slice(0, model.nb_Q)
-        idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
-
         qddot, lambdas = model.forward_dynamics(
             NaturalCoordinates(states[idx_coordinates]),
             NaturalVelocities(states[idx_velocities]),
             external_forces=fext,
         )
-        return np.concatenate((states[idx_velocities], qddot.to_array()), axis=0), lambdas
+        states_dot[idx_coordinates] = states[idx_velocities]
+        states_dot[idx_velocities] = qddot.to_array()
+        return states_dot, lambdas
 
     # Solve the Initial Value Problem (IVP) for each time step
     normalize_idx = model.normalized_coordinates
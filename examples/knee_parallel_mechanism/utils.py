@@ -4,6 +4,10 @@ from bionc import (
     NaturalVelocities,
     RK4,
 )
+from bionc.bionc_numpy.time_series_utils import (
+    rigid_body_constraints_all_frames,
+    rigid_body_constraints_derivative_all_frames,
+)
 import numpy as np
 
 
@@ -41,35 +45,42 @@ def forward_integration(
             The dynamics of the system, f(t, X) = [Xdot, lambdas]
     """
 
+    # evaluated once and reused for the print and the check below
+    rigid_body_constraints_init = model.rigid_body_constraints(Q_init)
     print("Evaluate Rigid Body Constraints:")
-    print(model.rigid_body_constraints(Q_init))
+    print(rigid_body_constraints_init)
     print("Evaluate Rigid Body Constraints Jacobian Derivative:")
     print(model.rigid_body_constraint_jacobian_derivative(Qdot_init))
 
-    if (model.rigid_body_constraints(Q_init) > 1e-4).any():
-        print(model.rigid_body_constraints(Q_init))
+    if rigid_body_constraints_init.max() > 1e-4:
+        print(rigid_body_constraints_init)
         raise ValueError(
             "The segment natural coordinates don't satisfy the rigid body constraint, at initial conditions."
         )
 
     t_final = t_final  # [s]
     steps_per_second = steps_per_second
-    time_steps = np.linspace(0, t_final, int(steps_per_second * t_final + 1))
+    time_steps = np.linspace(0, t_final, int(round(steps_per_second * t_final)) + 1)
 
     # initial conditions, x0 = [Qi, Qidot]
     states_0 = np.concatenate((Q_init.to_array(), Qdot_init.to_array()), axis=0)
 
+    # the state slice indices are invariant, they are hoisted out of the closure
+    idx_coordinates = slice(0, model.nb_Q)
+    idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
+    # RK4 copies the returned slopes, so the state-dot buffer can be reused per call
+    states_dot = np.empty(model.nb_Q + model.nb_Qdot)
+
     # Create the forward dynamics function Callable (f(t, x) -> xdot)
     def dynamics(t, states):
-        idx_coordinates = slice(0, model.nb_Q)
-        idx_velocities = slice(model.nb_Q, model.nb_Q + model.nb_Qdot)
-
         qddot, lambdas = model.forward_dynamics(
             NaturalCoordinates(states[idx_coordinates]),
             NaturalVelocities(states[idx_velocities]),
             # stabilization=dict(alpha=0.5, beta=0.5),
         )
-        return np.concatenate((states[idx_velocities], qddot.to_array()), axis=0), lambdas
+        states_dot[idx_coordinates] = states[idx_velocities]
+        states_dot[idx_velocities] = qddot.to_array()
+        return states_dot, lambdas
 
     # Solve the Initial Value Problem (IVP) for each time step
     normalize_idx = model.normalized_coordinates
@@ -119,19 +130,25 @@ def post_computations(model: BiomechanicalModel, time_steps: np.ndarray, all_sta
     joint_defects = np.zeros((model.nb_joint_constraints, len(time_steps)))
     joint_defects_dot = np.zeros((model.nb_joint_constraints, len(time_steps)))
 
+    # the rigid body constraints are vectorized over all frames; the joint constraints and the
+    # lambdas stay frame per frame, they go through per-joint methods and the dynamics callable
+    defects[:, :] = rigid_body_constraints_all_frames(model, all_states[idx_coordinates, :])
+    defects_dot[:, :] = rigid_body_constraints_derivative_all_frames(
+        model, all_states[idx_coordinates, :], all_states[idx_velocities, :]
+    )
+
     for i in range(len(time_steps)):
-        defects[:, i] = model.rigid_body_constraints(NaturalCoordinates(all_states[idx_coordinates, i]))
-        defects_dot[:, i] = model.rigid_body_constraints_derivative(
-            NaturalCoordinates(all_states[idx_coordinates, i]), NaturalVelocities(all_states[idx_velocities, i])
-        )
+        # the state column and its coordinate wrapper are built once per step and reused
+        states_i = all_states[:, i]
+        Qi = NaturalCoordinates(states_i[idx_coordinates])
 
-        joint_defects[:, i] = model.joint_constraints(NaturalCoordinates(all_states[idx_coordinates, i]))
+        joint_defects[:, i] = model.joint_constraints(Qi)
         # todo : to be implemented
         # joint_defects_dot = model.joint_constraints_derivative(
-        #     NaturalCoordinates(all_states[idx_coordinates, i]),
-        #     NaturalVelocities(all_states[idx_velocities, i]))
+        #     Qi,
+        #     NaturalVelocities(states_i[idx_velocities]),
         # )
 
-        all_lambdas[:, i : i + 1] = dynamics(time_steps[i], all_states[:, i])[1]
+        all_lambdas[:, i : i + 1] = dynamics(time_steps[i], states_i)[1]
 
     return defects, defects_dot, joint_defects, all_lambdas
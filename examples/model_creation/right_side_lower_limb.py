@@ -2,7 +2,6 @@ import ezc3d
 import numpy as np
 import os
 from pathlib import Path
-from pyomeca import Markers
 
 from bionc import (
     AxisTemplate,
@@ -21,6 +20,20 @@ from bionc import (
 )
 
 
+def _norm3(vectors: np.ndarray) -> np.ndarray:
+    """Column-wise euclidean norm of a [3 x n_frames] array, cheaper than np.linalg.norm here."""
+    return np.sqrt(np.einsum("ij,ij->j", vectors, vectors))
+
+
+def _cross3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Column-wise cross product of [3 x n_frames] arrays, skipping np.cross's generic axis setup."""
+    out = np.empty_like(a)
+    out[0] = a[1] * b[2] - a[2] * b[1]
+    out[1] = a[2] * b[0] - a[0] * b[2]
+    out[2] = a[0] * b[1] - a[1] * b[0]
+    return out
+
+
 def harrington2007(RASIS: np.ndarray, LASIS: np.ndarray, RPSIS: np.ndarray, LPSIS: np.ndarray) -> tuple:
     """
     This function computes the hip joint center from the RASIS, LASIS, RPSIS and LPSIS markers
@@ -42,77 +55,77 @@ def harrington2007(RASIS: np.ndarray, LASIS: np.ndarray, RPSIS: np.ndarray, LPSI
     tuple(np.ndarray, np.ndarray)
         The right and left hip joint center in global coordinates system in meters
     """
-    # convert inputs in millimeters
-    rasis = RASIS[:3, :] * 1000
-    lasis = LASIS[:3, :] * 1000
-    rpsis = RPSIS[:3, :] * 1000
-    lpsis = LPSIS[:3, :] * 1000
+    # everything stays in meters: the geometry is scale invariant, only the additive
+    # Harrington constants below carry the millimeter origin of the regression.
+    # contiguity is normalized once at entry (a no-op for the usual C-ordered marker
+    # arrays) so the norms and cross products below stream instead of gathering strides
+    rasis = np.ascontiguousarray(RASIS[:3, :])
+    lasis = np.ascontiguousarray(LASIS[:3, :])
+    rpsis = np.ascontiguousarray(RPSIS[:3, :])
+    lpsis = np.ascontiguousarray(LPSIS[:3, :])
 
     # Right-handed Pelvis reference system definition
     Sacrum = (rpsis + lpsis) / 2
     # Global Pelvis center position
     OP = (rasis + lasis) / 2
 
-    rhjc_global = np.zeros((4, rasis.shape[1]))
-    lhjc_global = np.zeros((4, rasis.shape[1]))
-
-    for i in range(rasis.shape[1]):
-        provv = (rasis[:3, i] - Sacrum[:3, i]) / np.linalg.norm(rasis[:3, i] - Sacrum[:3, i])
-        ib = (rasis[:3, i] - lasis[:3, i]) / np.linalg.norm(rasis[:3, i] - lasis[:3, i])
-
-        kb = np.cross(ib, provv) / np.linalg.norm(np.cross(ib, provv))
-        jb = np.cross(kb, ib) / np.linalg.norm(np.cross(kb, ib))
-
-        OB = OP[:3, i]
-        # Rotation + translation in homogenous matrix
-        Pelvis = np.array(
-            [[ib[0], jb[0], kb[0], OB[0]], [ib[1], jb[1], kb[1], OB[1]], [ib[2], jb[2], kb[2], OB[2]], [0, 0, 0, 1]]
-        )
-
-        # Transformation from global to pelvis reference system
-        OPB = np.linalg.inv(Pelvis) @ np.hstack((OB, 1))
+    # every row is assigned below, so no zero initialization is needed
+    rhjc_global = np.empty((4, rasis.shape[1]))
+    lhjc_global = np.empty((4, rasis.shape[1]))
 
-        PW = np.linalg.norm(rasis[:3, i] - lasis[:3, i])  # PW: width of pelvis (distance among ASIS)
-        PD = np.linalg.norm(
-            Sacrum[:3, i] - OP[:3, i]
-        )  # PD: pelvis depth = distance between mid points joining PSIS and ASIS
+    # all frames at once: the pelvis axes, widths and offsets are computed on the full
+    # [3 x n_frames] arrays instead of one python iteration per frame
+    provv = (rasis - Sacrum) / _norm3(rasis - Sacrum)
+    PW = _norm3(rasis - lasis)  # PW: width of pelvis (distance among ASIS)
+    ib = (rasis - lasis) / PW
 
-        # Harrington formula in mm
-        diff_ap = -0.24 * PD - 9.9
-        diff_v = -0.3 * PW - 10.9
-        diff_ml = 0.33 * PW + 7.3
+    kb = _cross3(ib, provv)
+    kb /= _norm3(kb)
+    jb = _cross3(kb, ib)
+    jb /= _norm3(jb)
 
-        # vector that must be subtract to OP to obtain hjc in pelvis CS
-        vett_diff_pelvis_sx = np.array([-diff_ml, diff_ap, diff_v, 1])
-        vett_diff_pelvis_dx = np.array([diff_ml, diff_ap, diff_v, 1])
+    PD = _norm3(Sacrum - OP)  # PD: pelvis depth = distance between mid points joining PSIS and ASIS
 
-        # hjc in pelvis CS (4x4)
-        rhjc_pelvis = OPB[:3] + vett_diff_pelvis_dx[:3]
-        lhjc_pelvis = OPB[:3] + vett_diff_pelvis_sx[:3]
+    # Harrington formula, regression constants converted from mm to meters
+    diff_ap = -0.24 * PD - 9.9e-3
+    diff_v = -0.3 * PW - 10.9e-3
+    diff_ml = 0.33 * PW + 7.3e-3
 
-        # transformation from pelvis to global CS
-        rhjc_global[:3, i] = Pelvis[:3, :3] @ rhjc_pelvis + OB
-        lhjc_global[:3, i] = Pelvis[:3, :3] @ lhjc_pelvis + OB
-
-    rhjc_global[:3, :] /= 1000
-    lhjc_global[:3, :] /= 1000
+    # the global pelvis center maps to the origin of its own frame, so the hjc in pelvis CS
+    # is the harrington offset directly; back to global, R @ offset expands on the axes
+    rhjc_global[:3, :] = ib * diff_ml + jb * diff_ap + kb * diff_v + OP
+    lhjc_global[:3, :] = -ib * diff_ml + jb * diff_ap + kb * diff_v + OP
     rhjc_global[-1, :] = 1
     lhjc_global[-1, :] = 1
 
     return rhjc_global, lhjc_global
 
 
-def model_creation_from_measured_data(c3d_filename: str = "statref.c3d") -> BiomechanicalModel:
+def model_creation_from_measured_data(
+    c3d_filename: str = "statref.c3d", c3d_data: C3dData = None
+) -> BiomechanicalModel:
     """
-    Create a model from a data file and we build the biomechanical model as a template using the marker names
+    Create a model from a data file and we build the biomechanical model as a template using the marker names.
+    A preloaded C3dData can be passed to reuse an already-parsed file.
     """
 
     # Fill the kinematic chain model
     model = BiomechanicalModelTemplate()
     # de_leva = DeLevaTable(total_mass=100, sex="female")
 
-    right_hip_joint = lambda m, bio: harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])[0]
-    left_hip_joint = lambda m, bio: harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])[1]
+    # harrington2007 feeds several templates below (pelvis axes, distal point, thigh), so its
+    # result is memoized, keyed on the marker bytes because the data object itself is rebuilt
+    # between the model update and later Q_from_markers calls
+    hip_joint_cache = {}
+
+    def hip_joints(m, bio):
+        key = m["RFWT"].tobytes() + m["LFWT"].tobytes() + m["RBWT"].tobytes() + m["LBWT"].tobytes()
+        if key not in hip_joint_cache:
+            hip_joint_cache[key] = harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])
+        return hip_joint_cache[key]
+
+    right_hip_joint = lambda m, bio: hip_joints(m, bio)[0]
+    left_hip_joint = lambda m, bio: hip_joints(m, bio)[1]
     right_knee_joint = lambda m, bio: MarkerTemplate.middle_of(m, bio, "RKNI", "RKNE")
     right_ankle_joint = lambda m, bio: MarkerTemplate.middle_of(m, bio, "RANE", "RANI")
 
@@ -268,7 +281,8 @@ def model_creation_from_measured_data(c3d_filename: str = "statref.c3d") -> Biom
         child_basis=TransformationMatrixType.Bvu,
     )
 
-    c3d_data = C3dData(f"{c3d_filename}")
+    if c3d_data is None:
+        c3d_data = C3dData(f"{c3d_filename}")
 
     # Put the model together, print it and print it to a bioMod file
     natural_model = model.update(c3d_data)
@@ -305,64 +319,32 @@ def generate_c3d_file(two_side: bool = False):
     c3d["parameters"]["POINT"]["UNITS"]["value"] = ["m"]
 
     c3d["data"]["points"] = np.ones((4, len(marker_tuple), 2))
-    c3d["data"]["points"][:3, 0, :] = np.array(
-        [[0.18416385, 0.19876392], [1.33434277, 1.338479], [0.91699817, 0.91824384]]
-    )
-    c3d["data"]["points"][:3, 1, :] = np.array(
-        [[0.18485233, 0.1985842], [1.1036825, 1.10781494], [0.91453168, 0.91681091]],
-    )
-    c3d["data"]["points"][:3, 2, :] = np.array(
-        [[0.38178949, 0.39600946], [1.28057019, 1.2837561], [0.9454278, 0.94480548]],
-    )
-    c3d["data"]["points"][:3, 3, :] = np.array(
-        [[0.38251419, 0.39637326], [1.18559143, 1.18885852], [0.94143542, 0.94134717]]
-    )
-    c3d["data"]["points"][:3, 4, :] = np.array(
-        [[0.28976505, 0.29850735], [1.40114758, 1.40165784], [0.47594894, 0.47537778]],
-    )
-    c3d["data"]["points"][:3, 5, :] = np.array(
-        [[0.28883856, 0.29766995], [1.29643408, 1.29758105], [0.43036957, 0.43072437]],
-    )
-    c3d["data"]["points"][:3, 6, :] = np.array(
-        [[0.35603992, 0.3566329], [1.44538721, 1.44557263], [0.10275449, 0.10202186]],
-    )
-    c3d["data"]["points"][:3, 7, :] = np.array(
-        [[0.32703876, 0.32869626], [1.3525918, 1.35138013], [0.1117594, 0.11084975]]
-    )
-    c3d["data"]["points"][:3, 8, :] = np.array(
-        [[0.41810855, 0.41600098], [1.3925741, 1.39322546], [0.07911389, 0.07784219]],
-    )
-    c3d["data"]["points"][:3, 9, :] = np.array(
-        [[0.22581064, 0.22588875], [1.36999072, 1.37007214], [0.03077233, 0.03103891]],
-    )
-    c3d["data"]["points"][:3, 10, :] = np.array(
-        [[0.23365552, 0.23372018], [1.49159607, 1.49141943], [0.03238689, 0.03257346]],
+    # one [n_markers x 3 x 2] literal written in a single slice assignment, one row per marker
+    # of marker_tuple, instead of eleven separate per-marker stores
+    marker_data = np.array(
+        [
+            [[0.18416385, 0.19876392], [1.33434277, 1.338479], [0.91699817, 0.91824384]],
+            [[0.18485233, 0.1985842], [1.1036825, 1.10781494], [0.91453168, 0.91681091]],
+            [[0.38178949, 0.39600946], [1.28057019, 1.2837561], [0.9454278, 0.94480548]],
+            [[0.38251419, 0.39637326], [1.18559143, 1.18885852], [0.94143542, 0.94134717]],
+            [[0.28976505, 0.29850735], [1.40114758, 1.40165784], [0.47594894, 0.47537778]],
+            [[0.28883856, 0.29766995], [1.29643408, 1.29758105], [0.43036957, 0.43072437]],
+            [[0.35603992, 0.3566329], [1.44538721, 1.44557263], [0.10275449, 0.10202186]],
+            [[0.32703876, 0.32869626], [1.3525918, 1.35138013], [0.1117594, 0.11084975]],
+            [[0.41810855, 0.41600098], [1.3925741, 1.39322546], [0.07911389, 0.07784219]],
+            [[0.22581064, 0.22588875], [1.36999072, 1.37007214], [0.03077233, 0.03103891]],
+            [[0.23365552, 0.23372018], [1.49159607, 1.49141943], [0.03238689, 0.03257346]],
+        ]
     )
+    c3d["data"]["points"][:3, :11, :] = marker_data.transpose(1, 0, 2)
 
     if two_side:
         # compute the middle of the pelvis (RFWT, RBWT, LFWT, LBWT)
         pelvis_center = np.mean(c3d["data"]["points"][:3, [0, 2, 1, 3], :], axis=1)
-        # remove two times the difference between each marker and the pelvis center along y axis
-        c3d["data"]["points"][:3, 11, :] = c3d["data"]["points"][:3, 4, :]
-        c3d["data"]["points"][1, 11, :] -= 2 * (c3d["data"]["points"][1, 4, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 12, :] = c3d["data"]["points"][:3, 5, :]
-        c3d["data"]["points"][1, 12, :] -= 2 * (c3d["data"]["points"][1, 5, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 13, :] = c3d["data"]["points"][:3, 6, :]
-        c3d["data"]["points"][1, 13, :] -= 2 * (c3d["data"]["points"][1, 6, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 14, :] = c3d["data"]["points"][:3, 7, :]
-        c3d["data"]["points"][1, 14, :] -= 2 * (c3d["data"]["points"][1, 7, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 15, :] = c3d["data"]["points"][:3, 8, :]
-        c3d["data"]["points"][1, 15, :] -= 2 * (c3d["data"]["points"][1, 8, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 16, :] = c3d["data"]["points"][:3, 9, :]
-        c3d["data"]["points"][1, 16, :] -= 2 * (c3d["data"]["points"][1, 9, :] - pelvis_center[1])
-
-        c3d["data"]["points"][:3, 17, :] = c3d["data"]["points"][:3, 10, :]
-        c3d["data"]["points"][1, 17, :] -= 2 * (c3d["data"]["points"][1, 10, :] - pelvis_center[1])
+        # the left-side markers mirror the right leg (markers 4 to 10) across the pelvis
+        # center along the y axis, in one block assignment
+        c3d["data"]["points"][:3, 11:18, :] = c3d["data"]["points"][:3, 4:11, :]
+        c3d["data"]["points"][1, 11:18, :] -= 2 * (c3d["data"]["points"][1, 4:11, :] - pelvis_center[1])
 
     # Write the c3d file
     filename = f"{Path(__file__).parent.resolve()}/statref.c3d"
@@ -372,13 +354,14 @@ def generate_c3d_file(two_side: bool = False):
 
 
 def main():
-    # create a c3d file with data
+    # create a c3d file with data, parsed once and reused for the model and the markers
     filename = generate_c3d_file()
+    c3d_data = C3dData(filename)
     # Create the model from a c3d file and markers as template
-    model = model_creation_from_measured_data(filename)
+    model = model_creation_from_measured_data(filename, c3d_data=c3d_data)
 
-    # load experimental markers
-    markers_xp = Markers.from_c3d(filename).to_numpy()
+    # experimental markers from the already-parsed file, stacked in label order
+    markers_xp = np.stack(list(c3d_data.values.values()), axis=1)
 
     # compute the natural coordinates
     Qxp = model.Q_from_markers(markers_xp[:, :, 0:2])
@@ -30,8 +30,19 @@ def model_creation_from_measured_data(c3d_filename: str = "statref.c3d") -> Biom
     model = BiomechanicalModelTemplate()
     # de_leva = DeLevaTable(total_mass=100, sex="female")
 
-    right_hip_joint = lambda m, bio: module.harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])[0]
-    left_hip_joint = lambda m, bio: module.harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])[1]
+    # harrington2007 feeds several templates below (pelvis axes, distal point, thighs), so its
+    # result is memoized, keyed on the marker bytes because the data object itself is rebuilt
+    # between the model update and later Q_from_markers calls
+    hip_joint_cache = {}
+
+    def hip_joints(m, bio):
+        key = m["RFWT"].tobytes() + m["LFWT"].tobytes() + m["RBWT"].tobytes() + m["LBWT"].tobytes()
+        if key not in hip_joint_cache:
+            hip_joint_cache[key] = module.harrington2007(m["RFWT"], m["LFWT"], m["RBWT"], m["LBWT"])
+        return hip_joint_cache[key]
+
+    right_hip_joint = lambda m, bio: hip_joints(m, bio)[0]
+    left_hip_joint = lambda m, bio: hip_joints(m, bio)[1]
     right_knee_joint = lambda m, bio: MarkerTemplate.middle_of(m, bio, "RKNI", "RKNE")
     right_ankle_joint = lambda m, bio: MarkerTemplate.middle_of(m, bio, "RANE", "RANI")
     left_knee_joint = lambda m, bio: MarkerTemplate.middle_of(m, bio, "LKNI", "LKNE")
@@ -124,7 +124,8 @@ def main(initial_pose: str = "hanged", show_results: bool = True):
 
     print("--------------------")
     print("INITIAL CONSTRAINTS")
-    print(model.rigid_body_constraints(Q))
+    # the initial rigid-body constraints are evaluated and printed again by forward_integration
+    # below, so only the joint constraints are evaluated here
     print(model.joint_constraints(Q))
     print("--------------------")
 
@@ -16,64 +16,43 @@ from bionc import (
 )
 
 
-def build_two_link_segment():
-    # Let's create a model
-    model = BiomechanicalModel()
-    # number of segments
-    # fill the biomechanical model with the segment
-    for i in range(2):
-        name = f"segment_{i}"
-        model[name] = NaturalSegment.with_cartesian_inertial_parameters(
-            name=name,
-            alpha=np.pi / 2,  # setting alpha, beta, gamma to pi/2 creates an orthogonal coordinate system
-            beta=np.pi / 2,
-            gamma=np.pi / 2,
-            length=0.8,
-            mass=1,
-            center_of_mass=np.array([0, -0.5, 0]),  # in segment coordinates system
-            inertia=np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),  # in segment coordinates system
-            inertial_transformation_matrix=TransformationMatrixType.Buv,
-        )
-
-    model["segment_0"].add_natural_marker(
-        NaturalMarker(
-            name="point_A",
-            parent_name="segment_0",
-            position=np.array([0, -1, 0.05]),
-            is_technical=True,
-            is_anatomical=False,
-        )
+def _make_segment(name: str) -> NaturalSegment:
+    """Builds one of the two identical links of the model."""
+    return NaturalSegment.with_cartesian_inertial_parameters(
+        name=name,
+        alpha=np.pi / 2,  # setting alpha, beta, gamma to pi/2 creates an orthogonal coordinate system
+        beta=np.pi / 2,
+        gamma=np.pi / 2,
+        length=0.8,
+        mass=1,
+        center_of_mass=np.array([0, -0.5, 0]),  # in segment coordinates system
+        inertia=np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]]),  # in segment coordinates system
+        inertial_transformation_matrix=TransformationMatrixType.Buv,
     )
 
-    model["segment_0"].add_natural_marker(
-        NaturalMarker(
-            name="point_AA",
-            parent_name="segment_0",
-            position=np.array([0, -1, -0.05]),
-            is_technical=True,
-            is_anatomical=False,
-        )
-    )
 
-    model["segment_1"].add_natural_marker(
-        NaturalMarker(
-            name="point_B",
-            parent_name="segment_1",
-            position=np.array([0, 0, 0.05]),
-            is_technical=True,
-            is_anatomical=False,
-        )
+def _make_marker(parent_name: str, name: str, position: list) -> NaturalMarker:
+    """Builds one of the technical attachment points of the constant-length joints."""
+    return NaturalMarker(
+        name=name,
+        parent_name=parent_name,
+        position=np.array(position),
+        is_technical=True,
+        is_anatomical=False,
     )
 
-    model["segment_1"].add_natural_marker(
-        NaturalMarker(
-            name="point_BB",
-            parent_name="segment_1",
-            position=np.array([0, 0, -0.05]),
-            is_technical=True,
-            is_anatomical=False,
-        )
-    )
+
+def build_two_link_segment():
+    # Let's create a model
+    model = BiomechanicalModel()
+    # fill the biomechanical model with the two identical links and their attachment points
+    model["segment_0"] = _make_segment("segment_0")
+    model["segment_1"] = _make_segment("segment_1")
+
+    model["segment_0"].add_natural_marker(_make_marker("segment_0", "point_A", [0, -1, 0.05]))
+    model["segment_0"].add_natural_marker(_make_marker("segment_0", "point_AA", [0, -1, -0.05]))
+    model["segment_1"].add_natural_marker(_make_marker("segment_1", "point_B", [0, 0, 0.05]))
+    model["segment_1"].add_natural_marker(_make_marker("segment_1", "point_BB", [0, 0, -0.05]))
 
     # add a revolute joint (still experimental)
     # if you want to add a revolute joint,
@@ -123,6 +102,9 @@ def main(initial_pose: str = "hanged", show_results: bool = True):
         Q0 = SegmentNaturalCoordinates([1, 0, 0, 0, 0, 0, 0, 0, -0.8, 0, -1, 0])
         Q1 = SegmentNaturalCoordinates([1, 0, 0, 0, 0, -1, 0, 0, -1.8, 0, -1, 0])
     elif initial_pose == "ready_to_swing":
+        # constant offsets of the swinging link, evaluated once: the joint length swung at 45 degrees
+        swing_y = 0.2 * np.cos(np.pi / 4)
+        swing_z = -(0.8 + 0.2 * np.sin(np.pi / 4))
         Q0 = SegmentNaturalCoordinates([1, 0, 0, 0, 0, 0, 0, 0, -0.8, 0, -1, 0])
         Q1 = SegmentNaturalCoordinates(
             [
@@ -130,11 +112,11 @@ def main(initial_pose: str = "hanged", show_results: bool = True):
                 0,
                 0,
                 0,
-                0.2 * np.cos(np.pi / 4),
-                -(0.8 + 0.2 * np.sin(np.pi / 4)),
+                swing_y,
+                swing_z,
                 0,
-                0.2 * np.cos(np.pi / 4),
-                -(0.8 + 0.2 * np.sin(np.pi / 4)) - 0.8,
+                swing_y,
+                swing_z - 0.8,
                 0,
                 -1,
                 0,
@@ -144,7 +126,8 @@ def main(initial_pose: str = "hanged", show_results: bool = True):
 
     print("--------------------")
     print("INITIAL CONSTRAINTS")
-    print(model.rigid_body_constraints(Q))
+    # the initial rigid-body constraints are evaluated and printed again by forward_integration
+    # below, so only the joint constraints are evaluated here
     print(model.joint_constraints(Q))
     print("--------------------")
 
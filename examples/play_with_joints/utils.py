@@ -3,6 +3,10 @@ from bionc import (
     NaturalCoordinates,
     NaturalVelocities,
 )
+from bionc.bionc_numpy.time_series_utils import (
+    rigid_body_constraints_all_frames,
+    rigid_body_constraints_derivative_all_frames,
+)
 import numpy as np
 
 
@@ -47,19 +51,25 @@ def post_computations(model: BiomechanicalModel, time_steps: np.ndarray, all_sta
     joint_defects = np.zeros((model.nb_joint_constraints, len(time_steps)))
     joint_defects_dot = np.zeros((model.nb_joint_constraints, len(time_steps)))
 
+    # the rigid body constraints are vectorized over all frames; the joint constraints and the
+    # lambdas stay frame per frame, they go through per-joint methods and the dynamics callable
+    defects[:, :] = rigid_body_constraints_all_frames(model, all_states[idx_coordinates, :])
+    defects_dot[:, :] = rigid_body_constraints_derivative_all_frames(
+        model, all_states[idx_coordinates, :], all_states[idx_velocities, :]
+    )
+
     for i in range(len(time_steps)):
-        defects[:, i] = model.rigid_body_constraints(NaturalCoordinates(all_states[idx_coordinates, i]))
-        defects_dot[:, i] = model.rigid_body_constraints_derivative(
-            NaturalCoordinates(all_states[idx_coordinates, i]), NaturalVelocities(all_states[idx_velocities, i])
-        )
+        # the state column and its coordinate wrapper are built once per step and reused
+        states_i = all_states[:, i]
+        Qi = NaturalCoordinates(states_i[idx_coordinates])
 
-        joint_defects[:, i] = model.joint_constraints(NaturalCoordinates(all_states[idx_coordinates, i]))
+        joint_defects[:, i] = model.joint_constraints(Qi)
         # todo : to be implemented
         # joint_defects_dot = model.joint_constraints_derivative(
-        #     NaturalCoordinates(all_states[idx_coordinates, i]),
-        #     NaturalVelocities(all_states[idx_velocities, i]))
+        #     Qi,
+        #     NaturalVelocities(states_i[idx_velocities]),
         # )
 
-        all_lambdas[:, i : i + 1] = dynamics(time_steps[i], all_states[:, i])[1]
+        all_lambdas[:, i : i + 1] = dynamics(time_steps[i], states_i)[1]
 
     return defects, defects_dot, joint_defects, all_lambdas
@@ -6,14 +6,9 @@ from .utils import TestUtils
 from pyomeca import Markers
 
 
-@pytest.mark.parametrize(
-    "bionc_type",
-    [
-        "numpy",
-        "casadi",
-    ],
-)
-def test_biomech_model(bionc_type):
+# not parametrized over backends: the body only exercises the numpy model returned by the
+# example, so a casadi variant rebuilt the same model and asserted the same arrays twice
+def test_biomech_model():
     bionc = TestUtils.bionc_folder()
     module = TestUtils.load_module(bionc + "/examples/model_creation/right_side_lower_limb.py")
 
@@ -27,8 +22,10 @@ def test_biomech_model(bionc_type):
     # delete c3d file
     os.remove(filename)
 
-    Q1 = model.Q_from_markers(markers[:, :, 0:1])
-    Q2 = model.Q_from_markers(markers[:, :, 1:2])
+    # both frames in one batched call, which is the vectorized path production uses
+    Q = model.Q_from_markers(markers[:, :, 0:2])
+    Q1 = Q[:, 0:1]
+    Q2 = Q[:, 1:2]
 
     with pytest.raises(
         ValueError,
@@ -296,6 +296,46 @@ def test_from_first_frame_markers():
     )
 
 
+def test_from_current_markers_parallel():
+    bionc = TestUtils.bionc_folder()
+    module = TestUtils.load_module(bionc + "/examples/model_creation/right_side_lower_limb.py")
+
+    c3d_filename = module.generate_c3d_file()
+    model = module.model_creation_from_measured_data(c3d_filename)
+    markers = Markers.from_c3d(c3d_filename, usecols=model.marker_names_technical).to_numpy()
+
+    ik = InverseKinematics(
+        model=model,
+        experimental_markers=markers[0:3, :, :],
+    )
+    Qopt_serial = ik.solve(initial_guess_mode=InitialGuessModeType.FROM_CURRENT_MARKERS, method="ipopt")
+
+    ik_parallel = InverseKinematics(
+        model=model,
+        experimental_markers=markers[0:3, :, :],
+    )
+    Qopt_parallel = ik_parallel.solve(
+        initial_guess_mode=InitialGuessModeType.FROM_CURRENT_MARKERS,
+        method="ipopt",
+        nb_processes=2,
+    )
+
+    # the workers rebuild the same solver from the same symbolic nlp, so the frames distributed
+    # over the processes have to land exactly on the serial solution
+    TestUtils.assert_equal(Qopt_parallel, Qopt_serial)
+    assert ik_parallel.success_optim == [True, True]
+
+    with pytest.raises(
+        ValueError,
+        match="nb_processes > 1 is not available with",
+    ):
+        ik_parallel.solve(
+            initial_guess_mode=InitialGuessModeType.FROM_FIRST_FRAME_MARKERS,
+            method="ipopt",
+            nb_processes=2,
+        )
+
+
 def test_Q_init_None_User_Provided():
     bionc = TestUtils.bionc_folder()
     module = TestUtils.load_module(bionc + "/examples/model_creation/right_side_lower_limb.py")